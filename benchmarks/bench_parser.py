@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: parsing FileList RSS entries
+Compares the single-pass parser against the previous three-regex parser
+"""
+
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import feedparser
+from filelist_handler.models import Torrent
+from filelist_handler.parsers import RSSFeedParser
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+ROUNDS = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+
+def legacy_parse_entry(entry: dict):
+    """The parser used before, kept here for comparison"""
+    title = entry.get('title', '')
+    link = entry.get('link', '')
+    description = entry.get('description', '')
+    is_freeleech = '[FreeLeech]' in title or '[FREELEECH]' in title.upper()
+    
+    size_bytes = 0
+    match = re.search(r'Size:\s*(\d+(?:\.\d+)?)\s*(GB|MB|KB|TB)', description, re.IGNORECASE)
+    if match:
+        multipliers = {'KB': 1024, 'MB': 1024**2, 'GB': 1024**3, 'TB': 1024**4}
+        size_bytes = int(float(match.group(1)) * multipliers.get(match.group(2).upper(), 1))
+    
+    match = re.search(r'Category:\s*([^\n]+)', description)
+    category = match.group(1).strip() if match else None
+    
+    match = re.search(r'id=(\d+)', link)
+    if not match:
+        return None
+    
+    return Torrent(
+        id=match.group(1), title=title, link=link, size=size_bytes,
+        is_freeleech=is_freeleech, added_date=datetime.now(), category=category, seeders=0
+    )
+
+
+def timed(name, func, entries):
+    """Run func over all entries ROUNDS times"""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        func(entries)
+    elapsed = time.perf_counter() - start
+    per_entry = elapsed / (ROUNDS * len(entries)) * 1e6
+    print(f"{name:<12} {elapsed * 1000:8.1f} ms   {per_entry:6.2f} µs/entry")
+    return elapsed
+
+
+def main():
+    """Main entry point"""
+    parser = RSSFeedParser('')
+    for fixture in sorted(FIXTURES.glob('*.xml')):
+        # Plain dicts, so the timings leave out FeedParserDict's key aliasing
+        entries = [
+            dict(entry, description=entry.get('description', ''))
+            for entry in feedparser.parse(str(fixture)).entries
+        ]
+        print(f"{fixture.name}: {len(entries)} entries x {ROUNDS} rounds")
+        
+        legacy = timed('three-regex', lambda es: [legacy_parse_entry(e) for e in es], entries)
+        single = timed('single-pass', parser.parse_entries, entries)
+        print(f"speedup      {legacy / single:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: loading and saving a repository of torrents
+Compares the slotted Torrent model against the previous dataclass model
+"""
+
+import sys
+import json
+import time
+import random
+import tracemalloc
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from filelist_handler.models import Torrent, TorrentStatus
+
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+CATEGORIES = ['Filme HD', 'Filme 4K', 'Seriale HD', 'Jocuri PC', 'Muzica', 'Docs', 'Linux']
+
+
+@dataclass
+class LegacyTorrent:
+    """The dataclass model used before, kept here for comparison"""
+    id: str
+    title: str
+    link: str
+    size: int
+    is_freeleech: bool
+    added_date: datetime
+    completed_date: Optional[datetime] = None
+    status: TorrentStatus = TorrentStatus.PENDING
+    category: Optional[str] = None
+    seeders: int = 0
+    
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data['added_date'] = self.added_date.isoformat()
+        data['completed_date'] = self.completed_date.isoformat() if self.completed_date else None
+        data['status'] = self.status.value
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'LegacyTorrent':
+        data['added_date'] = datetime.fromisoformat(data['added_date'])
+        data['completed_date'] = datetime.fromisoformat(data['completed_date']) if data['completed_date'] else None
+        data['status'] = TorrentStatus(data['status'])
+        return cls(**data)
+
+
+def make_records(model):
+    """Build COUNT torrents with realistic field values"""
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1)
+    torrents = {}
+    for i in range(COUNT):
+        torrent_id = str(900000 + i)
+        added = start + timedelta(seconds=rng.randint(0, 60 * 86400))
+        completed = added + timedelta(hours=rng.randint(1, 48)) if rng.random() < 0.8 else None
+        torrents[torrent_id] = model(
+            id=torrent_id,
+            title=f"Some.Release.Name.{i}.1080p.WEB-DL.x264-GROUP",
+            link=f"https://filelist.io/download.php?id={torrent_id}&passkey=0123456789abcdef",
+            size=rng.randint(100 * 1024**2, 50 * 1024**3),
+            is_freeleech=rng.random() < 0.3,
+            added_date=added,
+            completed_date=completed,
+            status=rng.choice(list(TorrentStatus)),
+            category=rng.choice(CATEGORIES),
+            seeders=rng.randint(0, 500),
+        )
+    return torrents
+
+
+def bench(name, model):
+    """Time save and load of COUNT torrents and measure resident size"""
+    torrents = make_records(model)
+    
+    start = time.perf_counter()
+    payload = json.dumps({k: v.to_dict() for k, v in torrents.items()})
+    save_time = time.perf_counter() - start
+    del torrents
+    
+    start = time.perf_counter()
+    loaded = {k: model.from_dict(v) for k, v in json.loads(payload).items()}
+    load_time = time.perf_counter() - start
+    del loaded
+    
+    # Measure the footprint of the loaded models on their own
+    records = json.loads(payload)
+    tracemalloc.start()
+    loaded = {k: model.from_dict(dict(v)) for k, v in records.items()}
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    print(f"{name:<10} save {save_time * 1000:8.1f} ms   load {load_time * 1000:8.1f} ms   "
+          f"models {memory / 1024**2:7.1f} MB   ({len(loaded)} torrents)")
+    return save_time, load_time, memory
+
+
+def main():
+    """Main entry point"""
+    print(f"Repository of {COUNT} torrents")
+    legacy = bench('dataclass', LegacyTorrent)
+    slotted = bench('slotted', Torrent)
+    print(f"speedup    save {legacy[0] / slotted[0]:.1f}x   load {legacy[1] / slotted[1]:.1f}x   "
+          f"memory {legacy[2] / slotted[2]:.1f}x smaller")
+
+
+if __name__ == '__main__':
+    main()
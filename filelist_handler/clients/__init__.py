@@ -3,6 +3,11 @@
 from .base import TorrentClient
 from .qbittorrent import QBittorrentClient
 from .transmission import TransmissionClient
+from .async_base import AsyncTorrentClient, SyncClientAdapter
+from .async_qbittorrent import AsyncQBittorrentClient
 
-__all__ = ['TorrentClient', 'QBittorrentClient', 'TransmissionClient']
+__all__ = [
+    'TorrentClient', 'QBittorrentClient', 'TransmissionClient',
+    'AsyncTorrentClient', 'SyncClientAdapter', 'AsyncQBittorrentClient',
+]
 
@@ -0,0 +1,104 @@
+"""Asynchronous torrent client interface and its synchronous adapter"""
+
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from typing import List, Dict, Optional
+from .base import TorrentClient
+
+
+class AsyncTorrentClient(ABC):
+    """Abstract asyncio torrent client interface"""
+    
+    async def connect(self) -> bool:
+        """Check that the client is reachable, clients log in lazily"""
+        return True
+    
+    @abstractmethod
+    async def add_torrent(self, torrent_url: str, save_path: str,
+                          tag: Optional[str] = None) -> Optional[bool]:
+        """Add a torrent to the client, like TorrentClient.add_torrent"""
+        pass
+    
+    async def add_torrents(self, torrent_urls: List[str], save_path: str,
+                           tags: Optional[List[str]] = None) -> List[Optional[bool]]:
+        """Add several torrents, returning one result per URL"""
+        return list(await asyncio.gather(*(
+            self.add_torrent(url, save_path, tag)
+            for url, tag in zip(torrent_urls, tags or [None] * len(torrent_urls))
+        )))
+    
+    @abstractmethod
+    async def get_torrents(self) -> List[Dict]:
+        """Get list of torrents from client"""
+        pass
+    
+    async def sync_torrents(self, rid: int = 0) -> Dict:
+        """Get torrent changes since ``rid``, shaped like TorrentClient.sync_torrents"""
+        torrents = {t['hash']: t for t in await self.get_torrents() if 'hash' in t}
+        return {'rid': 0, 'full_update': True, 'torrents': torrents, 'torrents_removed': []}
+    
+    @abstractmethod
+    async def remove_torrent(self, torrent_hash: str, delete_files: bool = True) -> bool:
+        """Remove a torrent from client"""
+        pass
+    
+    async def remove_torrents(self, torrent_hashes: List[str], delete_files: bool = True) -> bool:
+        """Remove several torrents from client"""
+        results = await asyncio.gather(
+            *(self.remove_torrent(h, delete_files) for h in torrent_hashes)
+        )
+        return all(results)
+    
+    async def close(self):
+        """Release connections held by the client"""
+        pass
+
+
+class SyncClientAdapter(TorrentClient):
+    """Exposes an AsyncTorrentClient through the synchronous interface (Adapter Pattern)
+    
+    The async client lives on an event loop in a background thread, and
+    each call blocks its caller until the coroutine finishes there. Calls
+    from several threads share the loop and the client's connections.
+    """
+    
+    def __init__(self, client: AsyncTorrentClient):
+        self.client = client
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name='async-client', daemon=True
+        )
+        self._thread.start()
+    
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+    
+    def connect(self) -> bool:
+        return self._run(self.client.connect())
+    
+    def add_torrent(self, torrent_url: str, save_path: str,
+                    tag: Optional[str] = None) -> Optional[bool]:
+        return self._run(self.client.add_torrent(torrent_url, save_path, tag))
+    
+    def add_torrents(self, torrent_urls: List[str], save_path: str,
+                     tags: Optional[List[str]] = None) -> List[Optional[bool]]:
+        return self._run(self.client.add_torrents(torrent_urls, save_path, tags))
+    
+    def get_torrents(self) -> List[Dict]:
+        return self._run(self.client.get_torrents())
+    
+    def sync_torrents(self, rid: int = 0) -> Dict:
+        return self._run(self.client.sync_torrents(rid))
+    
+    def remove_torrent(self, torrent_hash: str, delete_files: bool = True) -> bool:
+        return self._run(self.client.remove_torrent(torrent_hash, delete_files))
+    
+    def remove_torrents(self, torrent_hashes: List[str], delete_files: bool = True) -> bool:
+        return self._run(self.client.remove_torrents(torrent_hashes, delete_files))
+    
+    def close(self):
+        """Close the client and stop its event loop"""
+        self._run(self.client.close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
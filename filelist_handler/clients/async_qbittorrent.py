@@ -0,0 +1,190 @@
+"""qBittorrent Web API client on asyncio"""
+
+import asyncio
+import logging
+from typing import List, Dict, Optional
+from .async_base import AsyncTorrentClient
+from .qbittorrent import add_form
+
+try:
+    import aiohttp
+except ImportError:  # optional, only needed for torrent_client.use_asyncio
+    aiohttp = None
+
+
+class AsyncQBittorrentClient(AsyncTorrentClient):
+    """qBittorrent Web API client on asyncio
+    
+    Behaves like QBittorrentClient: logs in on first use, logs in again
+    once when a request is rejected with 403 and replays it, with
+    concurrent callers sharing that login. Requests go through an aiohttp
+    session with a pool of ``pool_size`` kept-alive connections.
+    """
+    
+    def __init__(self, host: str, username: str, password: str, connect_timeout: float = 10,
+                 read_timeout: float = 30, pool_size: int = 10):
+        if aiohttp is None:
+            raise ImportError("torrent_client.use_asyncio needs aiohttp: pip install aiohttp")
+        self.host = host.rstrip('/')
+        self.username = username
+        self.password = password
+        self.timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        self.pool_size = pool_size
+        self.session: Optional['aiohttp.ClientSession'] = None
+        self._login_lock: Optional[asyncio.Lock] = None
+        self._auth_generation = 0  # bumped on every successful login
+    
+    def _session(self) -> 'aiohttp.ClientSession':
+        if self.session is None:
+            # Created on first use so it binds to the loop the client runs on.
+            # qBittorrent is usually reached by IP, which needs an unsafe jar
+            # to keep the login cookie
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+                timeout=self.timeout,
+            )
+        return self.session
+    
+    async def _send(self, method: str, url: str, **kwargs) -> 'aiohttp.ClientResponse':
+        """Send a request and read the whole body, so it outlives the connection"""
+        async with self._session().request(method, url, **kwargs) as response:
+            await response.read()
+        return response
+    
+    async def connect(self) -> bool:
+        """Log in now, returns False when qBittorrent is not reachable"""
+        try:
+            await self._relogin(self._auth_generation)
+            return True
+        except ConnectionError as e:
+            logging.warning(f"qBittorrent not reachable yet: {e}")
+            return False
+    
+    async def _relogin(self, generation: int):
+        """Log in unless another caller already did since ``generation``"""
+        if self._login_lock is None:
+            # Created here so it binds to the loop the client runs on
+            self._login_lock = asyncio.Lock()
+        async with self._login_lock:
+            if self._auth_generation == generation:
+                await self._login()
+                self._auth_generation += 1
+    
+    async def _login(self):
+        """Login to qBittorrent"""
+        try:
+            response = await self._send(
+                'POST', f"{self.host}/api/v2/auth/login",
+                data={'username': self.username, 'password': self.password}
+            )
+            response.raise_for_status()
+            text = await response.text()
+        except Exception as e:
+            raise ConnectionError(f"Failed to login to qBittorrent: {e}")
+        
+        if text.strip() != 'Ok.':
+            raise ConnectionError(f"Login failed: {text}")
+        logging.info("✓ Connected to qBittorrent")
+    
+    async def _request(self, method: str, path: str, **kwargs) -> 'aiohttp.ClientResponse':
+        """Send an API request, logging in first or again when needed"""
+        generation = self._auth_generation
+        if generation == 0:
+            await self._relogin(generation)
+            generation = self._auth_generation
+        
+        url = f"{self.host}/api/v2/{path}"
+        response = await self._send(method, url, **kwargs)
+        if response.status == 403:
+            # Rejected before being handled, so replaying is safe
+            logging.info("→ qBittorrent session expired, logging in again")
+            await self._relogin(generation)
+            response = await self._send(method, url, **kwargs)
+        return response
+    
+    async def add_torrent(self, torrent_url: str, save_path: str,
+                          tag: Optional[str] = None) -> Optional[bool]:
+        """Add torrent via URL, None when qBittorrent could not be reached"""
+        try:
+            response = await self._request(
+                'POST', 'torrents/add', data=add_form([torrent_url], save_path, [tag])
+            )
+            text = (await response.text()).strip()
+        except Exception as e:
+            logging.error(f"Failed to add torrent: {e}")
+            return None
+        if text == 'Ok.':
+            return True
+        if text != '':
+            logging.debug(f"qBittorrent add_torrent response: '{text}'")
+        return False
+    
+    async def add_torrents(self, torrent_urls: List[str], save_path: str,
+                           tags: Optional[List[str]] = None) -> List[Optional[bool]]:
+        """Add several torrents in a single /torrents/add call
+        
+        Same rules as QBittorrentClient.add_torrents: one by one only after
+        a 'Fails.' reply, and no resending when qBittorrent is unreachable.
+        """
+        if len(torrent_urls) <= 1:
+            return await super().add_torrents(torrent_urls, save_path, tags)
+        
+        try:
+            response = await self._request(
+                'POST', 'torrents/add', data=add_form(torrent_urls, save_path, tags)
+            )
+            text = (await response.text()).strip()
+        except Exception as e:
+            logging.error(f"Failed to add torrent batch: {e}")
+            return [None] * len(torrent_urls)
+        
+        if text != 'Fails.':
+            return [text == 'Ok.'] * len(torrent_urls)
+        logging.debug("qBittorrent rejected the batch, adding torrents one by one")
+        return await super().add_torrents(torrent_urls, save_path, tags)
+    
+    async def get_torrents(self) -> List[Dict]:
+        """Get all torrents"""
+        try:
+            response = await self._request('GET', 'torrents/info')
+            response.raise_for_status()
+            return await response.json(content_type=None)
+        except Exception as e:
+            logging.error(f"Failed to get torrents: {e}")
+            return []
+    
+    async def sync_torrents(self, rid: int = 0) -> Dict:
+        """Get torrent changes since ``rid`` via /sync/maindata"""
+        response = await self._request('GET', 'sync/maindata', params={'rid': rid})
+        response.raise_for_status()
+        data = await response.json(content_type=None)
+        return {
+            'rid': data.get('rid', 0),
+            'full_update': data.get('full_update', False),
+            'torrents': data.get('torrents', {}),
+            'torrents_removed': data.get('torrents_removed', []),
+        }
+    
+    async def remove_torrent(self, torrent_hash: str, delete_files: bool = True) -> bool:
+        """Remove torrent"""
+        try:
+            response = await self._request(
+                'POST', 'torrents/delete',
+                data={'hashes': torrent_hash, 'deleteFiles': str(delete_files).lower()}
+            )
+            return response.status == 200
+        except Exception as e:
+            logging.error(f"Failed to remove torrent: {e}")
+            return False
+    
+    async def remove_torrents(self, torrent_hashes: List[str], delete_files: bool = True) -> bool:
+        """Remove several torrents in a single /torrents/delete call"""
+        if not torrent_hashes:
+            return True
+        return await self.remove_torrent('|'.join(torrent_hashes), delete_files)
+    
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
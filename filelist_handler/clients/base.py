@@ -1,24 +1,64 @@
 """Base torrent client interface (Strategy Pattern)"""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 
 class TorrentClient(ABC):
     """Abstract torrent client interface"""
     
+    def connect(self) -> bool:
+        """Check that the client is reachable, clients log in lazily"""
+        return True
+    
     @abstractmethod
-    def add_torrent(self, torrent_url: str, save_path: str) -> bool:
-        """Add a torrent to the client"""
+    def add_torrent(self, torrent_url: str, save_path: str,
+                    tag: Optional[str] = None) -> Optional[bool]:
+        """Add a torrent to the client
+        
+        Returns True when added, False when the client rejected it and None
+        when the client could not be reached. Clients with tags or labels
+        put ``tag`` on the torrent.
+        """
         pass
     
+    def add_torrents(self, torrent_urls: List[str], save_path: str,
+                     tags: Optional[List[str]] = None) -> List[Optional[bool]]:
+        """Add several torrents, returning one add_torrent result per URL
+        
+        ``tags`` holds one tag per URL.
+        """
+        results = []
+        for url, tag in zip(torrent_urls, tags or [None] * len(torrent_urls)):
+            result = self.add_torrent(url, save_path, tag)
+            results.append(result)
+            if result is None:
+                # Down for one, down for the rest
+                return results + [None] * (len(torrent_urls) - len(results))
+        return results
+    
     @abstractmethod
     def get_torrents(self) -> List[Dict]:
         """Get list of torrents from client"""
         pass
     
+    def sync_torrents(self, rid: int = 0) -> Dict:
+        """Get torrent changes since ``rid``
+        
+        Returns a dict shaped like qBittorrent's /sync/maindata: ``rid``,
+        ``full_update``, ``torrents`` (hash -> changed fields) and
+        ``torrents_removed``. Clients without incremental sync return the
+        full list every time.
+        """
+        torrents = {t['hash']: t for t in self.get_torrents() if 'hash' in t}
+        return {'rid': 0, 'full_update': True, 'torrents': torrents, 'torrents_removed': []}
+    
     @abstractmethod
     def remove_torrent(self, torrent_hash: str, delete_files: bool = True) -> bool:
         """Remove a torrent from client"""
         pass
+    
+    def remove_torrents(self, torrent_hashes: List[str], delete_files: bool = True) -> bool:
+        """Remove several torrents from client"""
+        return all([self.remove_torrent(h, delete_files) for h in torrent_hashes])
 
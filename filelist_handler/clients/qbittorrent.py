@@ -1,20 +1,70 @@
 """qBittorrent Web API client"""
 
 import logging
+import threading
 import requests
-from typing import List, Dict
+from typing import List, Dict, Optional
 from .base import TorrentClient
+from ..transport import HttpTransport
+
+
+def add_form(torrent_urls: List[str], save_path: str, tags: Optional[List[str]]) -> Dict[str, str]:
+    """Form fields of a /torrents/add call"""
+    form = {'urls': '\n'.join(torrent_urls), 'savepath': save_path}
+    tags = [tag for tag in tags or () if tag]
+    if tags:
+        form['tags'] = ','.join(tags)
+    return form
 
 
 class QBittorrentClient(TorrentClient):
-    """qBittorrent Web API client"""
+    """qBittorrent Web API client
+    
+    Logs in on first use rather than on construction, and again whenever
+    the session is rejected with 403 (expired cookie, qBittorrent restart).
+    Concurrent callers that hit the same expired session share one login,
+    then replay their request.
+    """
     
-    def __init__(self, host: str, username: str, password: str):
+    def __init__(self, host: str, username: str, password: str,
+                 session: Optional[requests.Session] = None):
         self.host = host.rstrip('/')
         self.username = username
         self.password = password
-        self.session = requests.Session()
-        self._login()
+        self.session = session or HttpTransport().session
+        self._login_lock = threading.Lock()
+        self._auth_generation = 0  # bumped on every successful login
+    
+    def connect(self) -> bool:
+        """Log in now, returns False when qBittorrent is not reachable"""
+        try:
+            self._relogin(self._auth_generation)
+            return True
+        except ConnectionError as e:
+            logging.warning(f"qBittorrent not reachable yet: {e}")
+            return False
+    
+    def _relogin(self, generation: int):
+        """Log in unless another caller already did since ``generation``"""
+        with self._login_lock:
+            if self._auth_generation == generation:
+                self._login()
+                self._auth_generation += 1
+    
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Send an API request, logging in first or again when needed"""
+        generation = self._auth_generation
+        if generation == 0:
+            self._relogin(generation)
+            generation = self._auth_generation
+        
+        response = self.session.request(method, f"{self.host}/api/v2/{path}", **kwargs)
+        if response.status_code == 403:
+            # Rejected before being handled, so replaying is safe
+            logging.info("→ qBittorrent session expired, logging in again")
+            self._relogin(generation)
+            response = self.session.request(method, f"{self.host}/api/v2/{path}", **kwargs)
+        return response
     
     def _login(self):
         """Login to qBittorrent"""
@@ -33,12 +83,12 @@ class QBittorrentClient(TorrentClient):
         except Exception as e:
             raise ConnectionError(f"Failed to login to qBittorrent: {e}")
     
-    def add_torrent(self, torrent_url: str, save_path: str) -> bool:
-        """Add torrent via URL"""
+    def add_torrent(self, torrent_url: str, save_path: str,
+                    tag: Optional[str] = None) -> Optional[bool]:
+        """Add torrent via URL, None when qBittorrent could not be reached"""
         try:
-            response = self.session.post(
-                f"{self.host}/api/v2/torrents/add",
-                data={'urls': torrent_url, 'savepath': save_path}
+            response = self._request(
+                'POST', 'torrents/add', data=add_form([torrent_url], save_path, [tag])
             )
             
             # qBittorrent returns 'Ok.' on success
@@ -51,27 +101,74 @@ class QBittorrentClient(TorrentClient):
                 return False
         except Exception as e:
             logging.error(f"Failed to add torrent: {e}")
-            return False
+            return None
+    
+    def add_torrents(self, torrent_urls: List[str], save_path: str,
+                     tags: Optional[List[str]] = None) -> List[Optional[bool]]:
+        """Add several torrents in a single /torrents/add call
+        
+        qBittorrent answers 'Ok.' when it took at least one of the URLs and
+        'Fails.' when it took none, so only a 'Fails.' is worth retrying one
+        by one. An 'Ok.' does not say which were taken, so all count as added.
+        
+        Tags apply to the whole request, so every torrent of a batch gets the
+        tags of all of them.
+        """
+        if len(torrent_urls) <= 1:
+            return super().add_torrents(torrent_urls, save_path, tags)
+        
+        try:
+            response = self._request(
+                'POST', 'torrents/add', data=add_form(torrent_urls, save_path, tags)
+            )
+        except Exception as e:
+            # Resending each URL would only hit the same outage n times
+            logging.error(f"Failed to add torrent batch: {e}")
+            return [None] * len(torrent_urls)
+        
+        if response.text.strip() != 'Fails.':
+            return [response.text.strip() == 'Ok.'] * len(torrent_urls)
+        # Fails. can also mean one bad URL took the batch down, find out which
+        logging.debug("qBittorrent rejected the batch, adding torrents one by one")
+        return super().add_torrents(torrent_urls, save_path, tags)
     
     def get_torrents(self) -> List[Dict]:
         """Get all torrents"""
         try:
-            response = self.session.get(f"{self.host}/api/v2/torrents/info")
+            response = self._request('GET', 'torrents/info')
             response.raise_for_status()
             return response.json()
         except Exception as e:
             logging.error(f"Failed to get torrents: {e}")
             return []
     
+    def sync_torrents(self, rid: int = 0) -> Dict:
+        """Get torrent changes since ``rid`` via /sync/maindata"""
+        response = self._request('GET', 'sync/maindata', params={'rid': rid})
+        response.raise_for_status()
+        data = response.json()
+        return {
+            'rid': data.get('rid', 0),
+            'full_update': data.get('full_update', False),
+            'torrents': data.get('torrents', {}),
+            'torrents_removed': data.get('torrents_removed', []),
+        }
+    
     def remove_torrent(self, torrent_hash: str, delete_files: bool = True) -> bool:
         """Remove torrent"""
         try:
-            response = self.session.post(
-                f"{self.host}/api/v2/torrents/delete",
+            response = self._request(
+                'POST', 'torrents/delete',
                 data={'hashes': torrent_hash, 'deleteFiles': str(delete_files).lower()}
             )
             return response.status_code == 200
         except Exception as e:
             logging.error(f"Failed to remove torrent: {e}")
             return False
+    
+    def remove_torrents(self, torrent_hashes: List[str], delete_files: bool = True) -> bool:
+        """Remove several torrents in a single /torrents/delete call"""
+        if not torrent_hashes:
+            return True
+        return self.remove_torrent('|'.join(torrent_hashes), delete_files)
 
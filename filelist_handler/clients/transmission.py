@@ -1,24 +1,194 @@
-"""Transmission RPC client (stub implementation)"""
+"""Transmission RPC client"""
 
-from typing import List, Dict
+import time
+import logging
+import requests
+from typing import Any, Dict, List, Optional
 from .base import TorrentClient
+from ..transport import HttpTransport
+
+SESSION_HEADER = 'X-Transmission-Session-Id'
+
+# ``recently-active`` only covers torrents that changed this long ago
+RECENTLY_ACTIVE_SECONDS = 60
+
+# Only what the sync and eviction code reads
+TORRENT_FIELDS = ['id', 'hashString', 'name', 'percentDone', 'status', 'error', 'doneDate', 'totalSize']
+
+# Transmission status codes mapped to qBittorrent-style state names
+STATES = {
+    0: 'stopped',
+    1: 'checkingWait',
+    2: 'checking',
+    3: 'queuedDL',
+    4: 'downloading',
+    5: 'queuedUP',
+    6: 'uploading',
+}
+
+
+class TransmissionError(ConnectionError):
+    """Transmission answered, but with an error result"""
 
 
 class TransmissionClient(TorrentClient):
-    """Transmission RPC client (stub implementation)"""
+    """Transmission client on the plain JSON-RPC protocol
+    
+    Torrents are reported in the same shape as qBittorrent's, so the rest
+    of the handler does not care which client it talks to. Incremental
+    sync uses the ``recently-active`` query, which only returns torrents
+    that changed and the IDs of removed ones. That query only looks back
+    a minute, so a sync after a longer pause fetches every torrent.
+    """
     
-    def __init__(self, host: str, username: str, password: str):
-        self.host = host
+    def __init__(self, host: str, username: str, password: str,
+                 session: Optional[requests.Session] = None):
+        self.host = host.rstrip('/')
+        self.rpc_url = self.host if self.host.endswith('/rpc') else f"{self.host}/transmission/rpc"
         self.username = username
         self.password = password
-        # Could use transmission-rpc library
+        self.session = session or HttpTransport().session
+        self.session_id: Optional[str] = None
+        self._hash_by_id: Dict[int, str] = {}
+        self._synced_at: Optional[float] = None
     
-    def add_torrent(self, torrent_url: str, save_path: str) -> bool:
-        raise NotImplementedError("Transmission client not fully implemented")
+    def connect(self) -> bool:
+        """Check that Transmission answers, returns False when it does not"""
+        try:
+            self._rpc('session-get', {'fields': ['version']})
+            logging.info("✓ Connected to Transmission")
+            return True
+        except ConnectionError as e:
+            logging.warning(f"Transmission not reachable yet: {e}")
+            return False
+    
+    def _rpc(self, method: str, arguments: Optional[Dict[str, Any]] = None) -> Dict:
+        """Call an RPC method and return its arguments
+        
+        Transmission answers 409 with a new session ID when ours is missing
+        or stale; the call is repeated once with that ID.
+        """
+        payload = {'method': method, 'arguments': arguments or {}}
+        auth = (self.username, self.password) if self.username else None
+        try:
+            for _ in range(2):
+                response = self.session.post(
+                    self.rpc_url, json=payload, auth=auth,
+                    headers={SESSION_HEADER: self.session_id or ''}
+                )
+                if response.status_code != 409:
+                    break
+                self.session_id = response.headers.get(SESSION_HEADER)
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            raise ConnectionError(f"Transmission {method} failed: {e}")
+        
+        if data.get('result') != 'success':
+            raise TransmissionError(f"Transmission {method} failed: {data.get('result')}")
+        return data.get('arguments', {})
+    
+    def add_torrent(self, torrent_url: str, save_path: str,
+                    tag: Optional[str] = None) -> Optional[bool]:
+        """Add torrent via URL, None when Transmission could not be reached
+        
+        ``tag`` is ignored, torrents are matched to the feed by name.
+        """
+        try:
+            result = self._rpc('torrent-add', {'filename': torrent_url, 'download-dir': save_path})
+        except TransmissionError as e:
+            logging.error(f"Failed to add torrent: {e}")
+            return False
+        except ConnectionError as e:
+            logging.error(f"Failed to add torrent: {e}")
+            return None
+        # A duplicate is already in the client, which is what we wanted
+        return 'torrent-added' in result or 'torrent-duplicate' in result
+    
+    def add_torrents(self, torrent_urls: List[str], save_path: str,
+                     tags: Optional[List[str]] = None) -> List[Optional[bool]]:
+        """Add several torrents over one kept-alive connection
+        
+        torrent-add takes a single torrent, so this is one call per URL.
+        """
+        return super().add_torrents(torrent_urls, save_path, tags)
     
     def get_torrents(self) -> List[Dict]:
-        raise NotImplementedError("Transmission client not fully implemented")
+        """Get all torrents"""
+        try:
+            result = self._rpc('torrent-get', {'fields': TORRENT_FIELDS})
+        except ConnectionError as e:
+            logging.error(f"Failed to get torrents: {e}")
+            return []
+        return [self._convert(t) for t in result.get('torrents', [])]
+    
+    def sync_torrents(self, rid: int = 0) -> Dict:
+        """Get torrent changes since the last sync
+        
+        Uses ``recently-active`` when the last sync is recent enough for it
+        to cover every change, otherwise gets all torrents and works out the
+        removed ones from the IDs seen before.
+        """
+        started = time.monotonic()
+        recent = (
+            bool(rid) and self._synced_at is not None
+            and started - self._synced_at < RECENTLY_ACTIVE_SECONDS
+        )
+        arguments: Dict[str, Any] = {'fields': TORRENT_FIELDS}
+        if recent:
+            arguments['ids'] = 'recently-active'
+        result = self._rpc('torrent-get', arguments)
+        self._synced_at = started
+        
+        torrents = {}
+        hash_by_id = self._hash_by_id if recent else {}
+        for raw in result.get('torrents', []):
+            torrent = self._convert(raw)
+            hash_by_id[raw['id']] = torrent['hash']
+            torrents[torrent['hash']] = torrent
+        
+        if recent:
+            removed = [
+                self._hash_by_id.pop(torrent_id)
+                for torrent_id in result.get('removed', [])
+                if torrent_id in self._hash_by_id
+            ]
+        else:
+            removed = [
+                torrent_hash for torrent_id, torrent_hash in self._hash_by_id.items()
+                if torrent_id not in hash_by_id
+            ]
+            self._hash_by_id = hash_by_id
+        return {
+            'rid': rid + 1,
+            'full_update': not recent,
+            'torrents': torrents,
+            'torrents_removed': removed,
+        }
+    
+    @staticmethod
+    def _convert(raw: Dict) -> Dict:
+        """Map a torrent-get entry to qBittorrent's field names"""
+        return {
+            'hash': raw['hashString'],
+            'name': raw.get('name', ''),
+            'progress': raw.get('percentDone', 0),
+            'state': 'error' if raw.get('error') else STATES.get(raw.get('status'), 'unknown'),
+            'completion_on': raw.get('doneDate', 0),
+            'size': raw.get('totalSize', 0),
+        }
     
     def remove_torrent(self, torrent_hash: str, delete_files: bool = True) -> bool:
-        raise NotImplementedError("Transmission client not fully implemented")
-
+        """Remove torrent"""
+        return self.remove_torrents([torrent_hash], delete_files)
+    
+    def remove_torrents(self, torrent_hashes: List[str], delete_files: bool = True) -> bool:
+        """Remove several torrents in a single torrent-remove call"""
+        if not torrent_hashes:
+            return True
+        try:
+            self._rpc('torrent-remove', {'ids': torrent_hashes, 'delete-local-data': delete_files})
+            return True
+        except ConnectionError as e:
+            logging.error(f"Failed to remove torrent: {e}")
+            return False
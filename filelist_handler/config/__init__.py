@@ -1,6 +1,7 @@
 """Configuration management"""
 
 from .config_manager import Config
+from .snapshot import ConfigSnapshot, Section, Field, SCHEMA, compile_config
 
-__all__ = ['Config']
+__all__ = ['Config', 'ConfigSnapshot', 'Section', 'Field', 'SCHEMA', 'compile_config']
 
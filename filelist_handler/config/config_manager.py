@@ -1,11 +1,20 @@
 """Configuration manager with Singleton pattern"""
 
+import logging
 import yaml
 from pathlib import Path
+from typing import Tuple
+from .snapshot import ConfigSnapshot, compile_config
 
 
 class Config:
-    """Singleton configuration manager"""
+    """Singleton configuration manager
+    
+    Settings are read from an immutable ConfigSnapshot. ``reload_if_changed``
+    loads config.yml again when its modification time changed and swaps in
+    the new snapshot in one assignment, so a reader always sees one
+    consistent version.
+    """
     _instance = None
     
     def __new__(cls):
@@ -26,8 +35,48 @@ class Config:
         if not self.config_file.exists():
             self.create_default_config()
         
+        # Reported once logging is set up, from the settings loaded here
+        self.snapshot: ConfigSnapshot
+        self.snapshot, self.errors = self._read()
+        self._rejected_version = None
+    
+    def _version(self) -> Tuple:
+        stat = self.config_file.stat()
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _read(self):
+        version = self._version()
         with open(self.config_file, 'r') as f:
-            self._config = yaml.safe_load(f)
+            return compile_config(yaml.safe_load(f), version)
+    
+    def reload_if_changed(self) -> bool:
+        """Load config.yml again if it changed, returns True when a new snapshot is in use
+        
+        A file that fails to parse or has invalid settings is reported and
+        the current snapshot stays in use.
+        """
+        try:
+            version = self._version()
+        except OSError as e:
+            logging.error(f"✗ Could not check {self.config_file.name}: {e}")
+            return False
+        if version in (self.snapshot.version, self._rejected_version):
+            return False
+        
+        try:
+            snapshot, errors = self._read()
+        except (OSError, yaml.YAMLError) as e:
+            logging.error(f"✗ Could not reload {self.config_file.name}: {e}")
+            self._rejected_version = version
+            return False
+        
+        if errors:
+            logging.error(f"✗ Not reloading {self.config_file.name}: {'; '.join(errors)}")
+            self._rejected_version = snapshot.version
+            return False
+        self.snapshot = snapshot
+        logging.info(f"✓ Reloaded {self.config_file.name}")
+        return True
     
     def create_default_config(self):
         """Create a default configuration file"""
@@ -36,21 +85,78 @@ class Config:
                 'rss_url': 'https://filelist.io/rss.php?feed=dl&cat=24,11,29,30,15,18,16,25,6,26,20,2,3,4,19,1,5,10,9,31,17,22,8,28,27,21,23,13,12,7&passkey=69e8a84f711e52ed4e63712d30a85c86',
                 'check_interval': 300,
                 'max_torrents_per_run': 5,
+                'feed_cache': 'feed_cache.json',
+                'seen_index': 'seen_ids.json',
+                'poll_scheduler': {
+                    'adaptive': True,
+                    'min_interval': 30,
+                    'max_interval': 900,
+                    'jitter': 0.1,
+                    'retry_delay': 60,
+                    'max_backoff': 3600,
+                },
             },
             'storage': {
                 'download_path': '/downloads',
                 'max_size_gb': 450,
                 'torrents_db': 'torrents.json',
+                'backend': 'journal',
+                'archive_deleted': False,
+                'rescan_interval': 3600,
             },
             'torrent_client': {
                 'type': 'qbittorrent',
                 'host': 'http://localhost:8080',
                 'username': 'admin',
                 'password': 'adminpass',
+                'use_asyncio': False,
+                'max_attempts': 5,
+                'retry_delay': 60,
+                'max_retry_delay': 3600,
+            },
+            'http': {
+                'pool_size': 10,
+                'connect_timeout': 10,
+                'read_timeout': 30,
+                'retries': 3,
+                'backoff_factor': 0.5,
             },
             'filters': {
                 'freeleech_only': True,
                 'min_seeders': 0,
+                'recheck_hours': 24,
+            },
+            'selection': {
+                'strategy': 'knapsack',
+                'freeleech_bonus': 2.0,
+                'age_half_life_hours': 24,
+                'category_weights': {},
+            },
+            'metrics': {
+                'enabled': True,
+                'host': '127.0.0.1',
+                'port': 9108,
+                'file': 'metrics.json',
+            },
+            'notifications': {
+                'queue_size': 1000,
+                'overflow': 'drop_new',
+                'block_timeout': 1.0,
+                'webhook_url': '',
+                'webhook_events': ['torrent_added', 'torrent_deleted', 'error'],
+            },
+            'profiling': {
+                'cycles': 0,
+                'signal_cycles': 3,
+                'output_dir': 'profiles',
+                'sort': 'cumulative',
+                'top': 30,
+                'memory': {
+                    'enabled': False,
+                    'interval_cycles': 12,
+                    'frames': 1,
+                    'top': 15,
+                },
             },
             'logging': {
                 'level': 'INFO',
@@ -60,19 +166,10 @@ class Config:
         
         with open(self.config_file, 'w') as f:
             yaml.dump(default_config, f, default_flow_style=False)
-        
-        self._config = default_config
     
     def get(self, key: str, default=None):
         """Get configuration value using dot notation"""
-        keys = key.split('.')
-        value = self._config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k, default)
-            else:
-                return default
-        return value
+        return self.snapshot.get(key, default)
     
     @property
     def rss_feed_url(self) -> str:
@@ -0,0 +1,184 @@
+"""Immutable, validated view of the configuration"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class Section(Mapping):
+    """Read-only config section whose keys are also attributes
+    
+    Values live in the instance ``__dict__``, so attribute access is a
+    plain attribute lookup.
+    """
+    
+    def __init__(self, values: Dict[str, Any]):
+        self.__dict__.update((k, _freeze(v)) for k, v in values.items())
+    
+    def __setattr__(self, name: str, value):
+        raise AttributeError("Configuration is read-only, edit config.yml instead")
+    
+    def __delattr__(self, name: str):
+        raise AttributeError("Configuration is read-only, edit config.yml instead")
+    
+    def __getitem__(self, key: str):
+        return self.__dict__[key]
+    
+    def __iter__(self):
+        return iter(self.__dict__)
+    
+    def __len__(self) -> int:
+        return len(self.__dict__)
+    
+    def __repr__(self) -> str:
+        return f"Section({self.__dict__})"
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return Section(value)
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class Field:
+    """Type and bounds of one setting, with the value used when it is missing"""
+    
+    def __init__(self, kind: type, default, minimum: Optional[float] = None,
+                 maximum: Optional[float] = None, choices: Optional[Sequence] = None):
+        self.kind = kind
+        self.default = default
+        self.minimum = minimum
+        self.maximum = maximum
+        self.choices = choices
+    
+    def validate(self, value):
+        """Return the value as the field's type, raises ValueError when invalid"""
+        if self.kind is int and isinstance(value, float) and value.is_integer():
+            value = int(value)
+        # Whole numbers are fine where a float is expected
+        kind = (int, float) if self.kind is float else self.kind
+        if not isinstance(value, kind) or (self.kind is not bool and isinstance(value, bool)):
+            raise ValueError(f"expected {'number' if self.kind is float else self.kind.__name__}, got {value!r}")
+        if self.choices is not None and value not in self.choices:
+            raise ValueError(f"expected one of {', '.join(map(str, self.choices))}, got {value!r}")
+        if self.minimum is not None and value < self.minimum:
+            raise ValueError(f"must be at least {self.minimum}, got {value!r}")
+        if self.maximum is not None and value > self.maximum:
+            raise ValueError(f"must be at most {self.maximum}, got {value!r}")
+        return value
+
+
+# Settings read by the handler. Anything else in config.yml is kept as is
+SCHEMA: Dict[str, Field] = {
+    'filelist.check_interval': Field(float, 300, minimum=1),
+    'filelist.max_torrents_per_run': Field(int, 5, minimum=0),
+    'filelist.feed_cache': Field(str, 'feed_cache.json'),
+    'filelist.seen_index': Field(str, 'seen_ids.json'),
+    'filelist.poll_scheduler.adaptive': Field(bool, True),
+    'filelist.poll_scheduler.min_interval': Field(float, 30, minimum=1),
+    'filelist.poll_scheduler.max_interval': Field(float, 900, minimum=1),
+    'filelist.poll_scheduler.jitter': Field(float, 0.1, minimum=0, maximum=1),
+    'filelist.poll_scheduler.retry_delay': Field(float, 60, minimum=0),
+    'filelist.poll_scheduler.max_backoff': Field(float, 3600, minimum=0),
+    'storage.download_path': Field(str, '/downloads'),
+    'storage.max_size_gb': Field(float, 450, minimum=0),
+    'storage.torrents_db': Field(str, 'torrents.json'),
+    'storage.backend': Field(str, 'journal', choices=('journal', 'sqlite', 'json')),
+    'storage.archive_deleted': Field(bool, False),
+    'storage.rescan_interval': Field(float, 3600, minimum=0),
+    'torrent_client.type': Field(str, 'qbittorrent', choices=('qbittorrent', 'transmission')),
+    'torrent_client.use_asyncio': Field(bool, False),
+    'torrent_client.max_attempts': Field(int, 5, minimum=1),
+    'torrent_client.retry_delay': Field(float, 60, minimum=0),
+    'torrent_client.max_retry_delay': Field(float, 3600, minimum=0),
+    'http.pool_size': Field(int, 10, minimum=1),
+    'http.connect_timeout': Field(float, 10, minimum=0),
+    'http.read_timeout': Field(float, 30, minimum=0),
+    'http.retries': Field(int, 3, minimum=0),
+    'http.backoff_factor': Field(float, 0.5, minimum=0),
+    'filters.freeleech_only': Field(bool, False),
+    'filters.min_seeders': Field(int, 0, minimum=0),
+    'filters.recheck_hours': Field(float, 24, minimum=0),
+    'selection.strategy': Field(str, 'knapsack', choices=('knapsack', 'first')),
+    'selection.freeleech_bonus': Field(float, 2.0, minimum=0),
+    'selection.age_half_life_hours': Field(float, 24, minimum=0.01),
+    'notifications.queue_size': Field(int, 1000, minimum=1),
+    'notifications.overflow': Field(str, 'drop_new', choices=('drop_new', 'drop_oldest', 'block')),
+    'notifications.block_timeout': Field(float, 1.0, minimum=0),
+    'metrics.enabled': Field(bool, True),
+    'metrics.host': Field(str, '127.0.0.1'),
+    'metrics.port': Field(int, 9108, minimum=0, maximum=65535),
+    'profiling.cycles': Field(int, 0, minimum=0),
+    'profiling.signal_cycles': Field(int, 3, minimum=1),
+    'profiling.memory.enabled': Field(bool, False),
+    'profiling.memory.interval_cycles': Field(int, 12, minimum=1),
+    'logging.level': Field(str, 'INFO', choices=('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')),
+    'logging.file': Field(str, 'filelist_handler.log'),
+}
+
+
+class ConfigSnapshot(Section):
+    """One loaded version of config.yml
+    
+    Sections and values read as attributes, ``snapshot.filters.min_seeders``,
+    and every dotted key is looked up in a single dict by ``get``.
+    """
+    
+    __slots__ = ('_flat', 'version')
+    
+    def __init__(self, values: Dict[str, Any], version: Tuple = ()):
+        super().__init__(values)
+        flat: Dict[str, Any] = {}
+        _flatten(self, '', flat)
+        object.__setattr__(self, '_flat', flat)
+        object.__setattr__(self, 'version', version)  # file mtime and size
+    
+    def get(self, key: str, default=None):
+        """Value of a dotted key such as 'filters.min_seeders'"""
+        return self._flat.get(key, default)
+
+
+def _flatten(section: Section, prefix: str, flat: Dict[str, Any]):
+    for key, value in section.items():
+        flat[prefix + key] = value
+        if isinstance(value, Section):
+            _flatten(value, f"{prefix}{key}.", flat)
+
+
+def compile_config(raw: Optional[dict], version: Tuple = ()) -> Tuple[ConfigSnapshot, List[str]]:
+    """Validate raw YAML data into a snapshot
+    
+    Missing settings get their defaults, and so do invalid ones; the
+    returned list says what was invalid and why.
+    """
+    values = _copy(raw) if isinstance(raw, dict) else {}
+    errors = []
+    for key, field in SCHEMA.items():
+        *path, name = key.split('.')
+        section = values
+        for part in path:
+            if not isinstance(section.get(part), dict):
+                if section.get(part) is not None:
+                    errors.append(f"{key.rsplit('.', 1)[0]}: expected a section, got {section[part]!r}")
+                section[part] = {}
+            section = section[part]
+        
+        value = section.get(name)
+        if value is None:
+            section[name] = field.default
+            continue
+        try:
+            section[name] = field.validate(value)
+        except ValueError as e:
+            errors.append(f"{key}: {e}")
+            section[name] = field.default
+    return ConfigSnapshot(values, version), errors
+
+
+def _copy(value):
+    if isinstance(value, dict):
+        return {str(k): _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    return value
@@ -0,0 +1,6 @@
+"""Opt-in CPU profiling and memory tracking for the long-running handler"""
+
+from .profiler import CycleProfiler
+from .memory import MemoryTracker
+
+__all__ = ['CycleProfiler', 'MemoryTracker']
@@ -0,0 +1,111 @@
+"""cProfile over a number of feed checks"""
+
+import io
+import time
+import sys
+import pstats
+import logging
+import cProfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Optional
+
+
+# cProfile runs on sys.monitoring, which sees all threads
+PROFILES_ALL_THREADS = sys.version_info >= (3, 12)
+
+
+class CycleProfiler:
+    """Profiles the next ``cycles`` feed checks and writes sorted stats
+    
+    Arming is cheap and safe from a signal handler; profiling starts with
+    the next check and all armed checks go into one report. Threads the
+    check starts are profiled when they run inside ``thread()``; their
+    stats are merged with those of the thread running the check. From
+    Python 3.12 cProfile covers every thread of the process by itself, and
+    only one profile can be active, so ``thread()`` does nothing there.
+    """
+    
+    def __init__(self, output_dir: str = 'profiles', sort: str = 'cumulative', top: int = 30):
+        self.output_dir = Path(output_dir)
+        self.sort = sort
+        self.top = top
+        self._requested = 0
+        self._remaining = 0
+        self._profile: Optional[cProfile.Profile] = None
+        self._thread_profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+    
+    @property
+    def active(self) -> bool:
+        return self._profile is not None
+    
+    def arm(self, cycles: int):
+        """Profile the next ``cycles`` checks"""
+        if cycles > 0:
+            self._requested = cycles
+    
+    @contextmanager
+    def cycle(self):
+        """Wrap one feed check, profiling it when armed"""
+        with self._lock:
+            if self._profile is None and self._requested:
+                self._remaining, self._requested = self._requested, 0
+                self._profile = cProfile.Profile()
+                logging.info(f"→ Profiling the next {self._remaining} feed checks")
+            profile = self._profile
+        if profile is None:
+            yield
+            return
+        
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._remaining -= 1
+            if self._remaining <= 0:
+                with self._lock:
+                    self._profile = None
+                    thread_profiles, self._thread_profiles = self._thread_profiles, []
+                self._dump(profile, thread_profiles)
+    
+    @contextmanager
+    def thread(self):
+        """Wrap the work of a thread started by the check being profiled"""
+        if self._profile is None or PROFILES_ALL_THREADS:
+            yield
+            return
+        
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            # Another profiler is active, the thread still has to do its work
+            logging.debug(f"Not profiling {threading.current_thread().name}: {e}")
+            yield
+            return
+        try:
+            yield
+        finally:
+            profile.disable()
+            with self._lock:
+                self._thread_profiles.append(profile)
+    
+    def _dump(self, profile: cProfile.Profile, thread_profiles: List[cProfile.Profile]):
+        """Write the merged raw profile and a sorted text report"""
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        report = io.StringIO()
+        stats = pstats.Stats(profile, stream=report)
+        for thread_profile in thread_profiles:
+            stats.add(thread_profile)
+        stats.sort_stats(self.sort).print_stats(self.top)
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            stats.dump_stats(str(self.output_dir / f"profile-{stamp}.prof"))
+            (self.output_dir / f"profile-{stamp}.txt").write_text(report.getvalue())
+        except OSError as e:
+            logging.error(f"Failed to write profile: {e}")
+        logging.info(f"✓ Profile written to {self.output_dir}/profile-{stamp}.txt")
+        logging.debug(report.getvalue())
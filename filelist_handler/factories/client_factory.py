@@ -1,24 +1,38 @@
 """Factory for creating torrent clients"""
 
-from ..clients import TorrentClient, QBittorrentClient, TransmissionClient
+from typing import Optional
+from ..clients import (
+    TorrentClient, QBittorrentClient, TransmissionClient,
+    AsyncQBittorrentClient, SyncClientAdapter
+)
 from ..config import Config
+from ..transport import HttpTransport
 
 
 class TorrentClientFactory:
     """Factory for creating torrent clients"""
     
     @staticmethod
-    def create_client(config: Config) -> TorrentClient:
+    def create_client(config: Config, transport: Optional[HttpTransport] = None) -> TorrentClient:
         """Create appropriate torrent client based on configuration"""
+        session = transport.session if transport else None
         client_type = config.get('torrent_client.type', 'qbittorrent')
         host = config.get('torrent_client.host')
         username = config.get('torrent_client.username')
         password = config.get('torrent_client.password')
         
-        if client_type == 'qbittorrent':
-            return QBittorrentClient(host, username, password)
+        if client_type == 'qbittorrent' and config.get('torrent_client.use_asyncio', False):
+            # Runs on its own event loop and aiohttp pool instead of the shared requests pool
+            return SyncClientAdapter(AsyncQBittorrentClient(
+                host, username, password,
+                config.get('http.connect_timeout', 10),
+                config.get('http.read_timeout', 30),
+                config.get('http.pool_size', 10)
+            ))
+        elif client_type == 'qbittorrent':
+            return QBittorrentClient(host, username, password, session)
         elif client_type == 'transmission':
-            return TransmissionClient(host, username, password)
+            return TransmissionClient(host, username, password, session)
         else:
             raise ValueError(f"Unknown torrent client type: {client_type}")
 
@@ -1,15 +1,30 @@
 """Main application logic"""
 
 import time
+import signal
 import logging
-from typing import List
+import threading
+from typing import Dict, List, Optional
 
 from .config import Config
 from .models import Torrent, TorrentStatus
-from .parsers import RSSFeedParser
-from .storage import StorageManager, TorrentRepository
+from .parsers import (
+    RSSFeedParser, FeedPoller, FeedSource, PollScheduler, AdaptivePollScheduler
+)
+from .storage import (
+    StorageManager, TorrentRepository, SeenIndex, EvictionPlanner, SubmissionOutbox
+)
 from .factories import TorrentClientFactory
-from .observers import Subject, LoggingObserver
+from .observers import (
+    Subject, LoggingObserver, WebhookObserver, TorrentAdded, TorrentCompleted,
+    TorrentDeleted, ErrorEvent, FeedChecked, CycleFinished
+)
+from .sync import ClientStateSync, client_tag
+from .pipeline import FeedCycle
+from .selection import ValueScorer, KnapsackSelector
+from .transport import HttpTransport
+from .metrics import MetricsRegistry, MetricsServer, save_snapshot
+from .diagnostics import CycleProfiler, MemoryTracker
 
 
 class FileListHandler(Subject):
@@ -19,39 +34,198 @@ class FileListHandler(Subject):
         super().__init__()
         self.config = Config()
         self.setup_logging()
+        for error in self.config.errors:
+            logging.error(f"✗ Invalid setting {error}, using the default")
         
         # Attach logging observer
         self.attach(LoggingObserver())
         
-        # Initialize components with retry logic
-        self.rss_parser = RSSFeedParser(self.config.rss_feed_url)
+        # Latency and counters, served by run() and saved for --stats
+        self.metrics = MetricsRegistry()
+        self.metrics_file = self.config.get('metrics.file', 'metrics.json')
+        self._create_diagnostics()
+        
+        # Feeds and the torrent client share one connection pool
+        self.transport = HttpTransport.from_config(self.config)
+        self._create_notifications()
+        
+        # Initialize components
+        self.feed_poller = FeedPoller(
+            self._create_feeds(), self._create_scheduler(), self.transport.session
+        )
         self.torrent_client = self._connect_to_torrent_client()
         self.storage_manager = StorageManager(
             self.config.get('storage.download_path'),
-            self.config.get('storage.max_size_gb')
+            self.config.get('storage.max_size_gb'),
+            self.config.get('storage.rescan_interval', 3600)
         )
         self.repository = TorrentRepository(
-            self.config.get('storage.torrents_db', 'torrents.json')
+            self.config.get('storage.torrents_db', 'torrents.json'),
+            self.config.get('storage.backend', 'journal'),
+            self.config.get('storage.archive_deleted', False)
+        )
+        self.seen_index = SeenIndex(
+            self.config.get('filelist.seen_index', 'seen_ids.json'),
+            recheck_seconds=self.config.get('filters.recheck_hours', 24) * 3600
+        )
+        if len(self.seen_index) == 0:
+            self.seen_index.update(t.id for t in self.repository.get_all())
+            self.seen_index.update(t.id for t in self.repository.iter_archived())
+        self.client_sync = ClientStateSync(
+            self.torrent_client, self.repository, self.storage_manager
         )
+        self.eviction_planner = EvictionPlanner()
+        self.outbox = SubmissionOutbox(
+            self.repository,
+            self.config.get('torrent_client.max_attempts', 5),
+            self.config.get('torrent_client.retry_delay', 60),
+            self.config.get('torrent_client.max_retry_delay', 3600)
+        )
+        
+        self.selector = self._create_selector()
+        
+        # Guards repository and storage bookkeeping across pipeline stages
+        self.state_lock = threading.RLock()
+        self.pipeline_stats = {}
         
         # Get max torrents per run
         self.max_torrents_per_run = self.config.get('filelist.max_torrents_per_run', 5)
     
-    def _connect_to_torrent_client(self, max_retries=30, retry_delay=2):
-        """Connect to torrent client with retry logic"""
-        for attempt in range(1, max_retries + 1):
-            try:
-                client = TorrentClientFactory.create_client(self.config)
-                logging.info(f"✓ Connected to torrent client on attempt {attempt}")
-                return client
-            except ConnectionError as e:
-                if attempt < max_retries:
-                    logging.warning(f"Attempt {attempt}/{max_retries}: qBittorrent not ready, retrying in {retry_delay}s... ({e})")
-                    time.sleep(retry_delay)
-                else:
-                    logging.error(f"Failed to connect after {max_retries} attempts")
-                    raise
-        raise ConnectionError("Failed to connect to torrent client")
+    def _create_feeds(self) -> List[FeedSource]:
+        """Create feed sources from filelist.feeds, or the single rss_url"""
+        cache_path = self.config.get('filelist.feed_cache', 'feed_cache.json')
+        default_interval = self.config.get('filelist.check_interval', 300)
+        default_filters = {
+            'freeleech_only': self.config.get('filters.freeleech_only'),
+            'min_seeders': self.config.get('filters.min_seeders', 0),
+        }
+        
+        feeds_config = self.config.get('filelist.feeds') or [
+            {'name': 'default', 'rss_url': self.config.rss_feed_url}
+        ]
+        feeds = []
+        for i, feed_config in enumerate(feeds_config):
+            feeds.append(FeedSource(
+                feed_config.get('name', f"feed{i + 1}"),
+                RSSFeedParser(feed_config['rss_url'], cache_path, self.transport.session),
+                feed_config.get('check_interval', default_interval),
+                {**default_filters, **feed_config.get('filters', {})}
+            ))
+        return feeds
+    
+    def _create_scheduler(self) -> PollScheduler:
+        """Create the poll scheduler, adaptive unless disabled"""
+        jitter = self.config.get('filelist.poll_scheduler.jitter', 0.1)
+        retry_delay = self.config.get('filelist.poll_scheduler.retry_delay', 60)
+        max_backoff = self.config.get('filelist.poll_scheduler.max_backoff', 3600)
+        if not self.config.get('filelist.poll_scheduler.adaptive', True):
+            return PollScheduler(jitter, retry_delay, max_backoff)
+        return AdaptivePollScheduler(
+            self.config.get('filelist.poll_scheduler.min_interval', 30),
+            self.config.get('filelist.poll_scheduler.max_interval', 900),
+            jitter,
+            retry_delay,
+            max_backoff
+        )
+    
+    def reload_config(self):
+        """Pick up changes to config.yml between checks"""
+        old = self.config.snapshot
+        if not self.config.reload_if_changed():
+            return
+        new = self.config.snapshot
+        
+        logging.getLogger().setLevel(getattr(logging, new.logging.level))
+        self.feed_poller.update_feeds(self._create_feeds())
+        self.feed_poller.scheduler = self._create_scheduler()
+        self.selector = self._create_selector()
+        self.max_torrents_per_run = new.filelist.max_torrents_per_run
+        self.storage_manager.max_size_bytes = int(new.storage.max_size_gb * 1024**3)
+        self.outbox.max_attempts = new.torrent_client.max_attempts
+        self.outbox.retry_delay = new.torrent_client.retry_delay
+        self.outbox.max_retry_delay = new.torrent_client.max_retry_delay
+        self.seen_index.recheck_seconds = new.filters.recheck_hours * 3600
+        
+        # Objects built from these are not rebuilt while running
+        for key in ('torrent_client', 'http', 'notifications', 'metrics', 'profiling', 'logging.file',
+                    'storage.download_path', 'storage.torrents_db', 'storage.backend',
+                    'storage.archive_deleted', 'storage.rescan_interval',
+                    'filelist.feed_cache', 'filelist.seen_index'):
+            if old.get(key) != new.get(key):
+                logging.warning(f"→ Change to {key} takes effect after a restart")
+    
+    def _create_notifications(self):
+        """Attach configured notifiers, delivered from a worker thread"""
+        self.start_event_bus(
+            self.config.get('notifications.queue_size', 1000),
+            self.config.get('notifications.overflow', 'drop_new'),
+            self.config.get('notifications.block_timeout', 1.0)
+        )
+        webhook_url = self.config.get('notifications.webhook_url')
+        if webhook_url:
+            self.attach(WebhookObserver(
+                webhook_url, self.transport.session,
+                self.config.get('notifications.webhook_events') or
+                ('torrent_added', 'torrent_deleted', 'error')
+            ))
+    
+    def _create_diagnostics(self):
+        """Create the profiler and memory tracker, started by config or signals"""
+        output_dir = self.config.get('profiling.output_dir', 'profiles')
+        self.profiler = CycleProfiler(
+            output_dir,
+            self.config.get('profiling.sort', 'cumulative'),
+            self.config.get('profiling.top', 30)
+        )
+        self.profiler.arm(self.config.get('profiling.cycles', 0))
+        self.memory_tracker = MemoryTracker(
+            self.config.get('profiling.memory.interval_cycles', 12),
+            self.config.get('profiling.memory.frames', 1),
+            self.config.get('profiling.memory.top', 15),
+            output_dir
+        )
+        if self.config.get('profiling.memory.enabled', False):
+            self.memory_tracker.start()
+    
+    def _install_signal_handlers(self):
+        """SIGUSR1 profiles the next checks, SIGUSR2 starts or reports memory tracing"""
+        cycles = self.config.get('profiling.signal_cycles', 3)
+        handlers = {
+            'SIGUSR1': lambda signum, frame: self.profiler.arm(cycles),
+            'SIGUSR2': lambda signum, frame: self.memory_tracker.request_snapshot(),
+        }
+        for name, handler in handlers.items():
+            # Not available on Windows
+            if hasattr(signal, name):
+                signal.signal(getattr(signal, name), handler)
+    
+    def _create_selector(self) -> Optional[KnapsackSelector]:
+        """Create the candidate selector, None to take candidates as they come"""
+        strategy = self.config.get('selection.strategy', 'knapsack')
+        if strategy == 'first':
+            return None
+        if strategy != 'knapsack':
+            logging.warning(f"Unknown selection strategy '{strategy}', using knapsack")
+        
+        scorer = ValueScorer(
+            self.config.get('selection.category_weights') or {},
+            self.config.get('selection.freeleech_bonus', 2.0),
+            self.config.get('selection.age_half_life_hours', 24) * 3600
+        )
+        return KnapsackSelector(scorer)
+    
+    def _connect_to_torrent_client(self):
+        """Create the torrent client without waiting for it to come up
+        
+        The client logs in on first use, so feeds are read while it is still
+        starting; adds that fail are picked up again by the next poll.
+        """
+        client = TorrentClientFactory.create_client(self.config, self.transport)
+        if client.connect():
+            logging.info("✓ Connected to torrent client")
+        else:
+            logging.warning("✗ Torrent client not reachable, will retry on the next check")
+        return client
     
     def setup_logging(self):
         """Setup logging configuration"""
@@ -67,137 +241,317 @@ class FileListHandler(Subject):
             ]
         )
     
-    def should_download(self, torrent: Torrent) -> bool:
+    def should_download(self, torrent: Torrent, filters: Optional[Dict] = None) -> bool:
         """Check if torrent meets download criteria"""
         # Check if already exists
         if self.repository.exists(torrent.id):
             return False
         
+        # Feeds may override the global filters
+        if filters is None:
+            filters = self.config.snapshot.filters
+        
         # Check freeleech requirement
-        if self.config.get('filters.freeleech_only') and not torrent.is_freeleech:
+        if filters.get('freeleech_only') and not torrent.is_freeleech:
             return False
         
         # Check minimum seeders
-        min_seeders = self.config.get('filters.min_seeders', 0)
+        min_seeders = filters.get('min_seeders') or 0
         if torrent.seeders < min_seeders:
             return False
         
         return True
     
-    def cleanup_storage(self, required_space: int = 0):
-        """Remove old torrents to free up space"""
-        while self.storage_manager.needs_cleanup(required_space):
-            all_torrents = self.repository.get_all()
-            oldest = self.storage_manager.get_oldest_torrents(all_torrents, count=1)
-            
-            if not oldest:
-                self.notify('error', {'message': 'No torrents available for cleanup'})
-                break
-            
-            torrent = oldest[0]
+    def _client_call(self, call: str):
+        """Time a torrent client API call"""
+        return self.metrics.timer('client_request_seconds', 'Torrent client API call latency', call=call)
+    
+    def sync_client_state(self):
+        """Pull torrent progress from the client into the repository"""
+        try:
+            with self._client_call('sync_torrents'):
+                completed = self.client_sync.sync()
+        except Exception as e:
+            self.notify(ErrorEvent(f"Failed to sync torrent client state: {e}"))
+            return
+        
+        for torrent in completed:
+            self.notify(TorrentCompleted(torrent.title))
+    
+    def download_budget(self) -> int:
+        """Bytes new torrents may take, counting space eviction can free"""
+        free = self.storage_manager.max_size_bytes - self.storage_manager.get_folder_size()
+        evictable = sum(t.size for t in self.repository.iter_evictable() if t.info_hash)
+        return max(0, free + evictable)
+    
+    def cleanup_storage(self, required_space: int = 0) -> bool:
+        """Remove old torrents to free up space
+        
+        Returns False when required_space does not fit; nothing is removed
+        then, since evicting only part of what is needed gains nothing.
+        """
+        with self.metrics.timer('storage_check_seconds', 'Time to check free space and plan evictions'):
+            space_needed = self.storage_manager.space_to_free(required_space)
+            if space_needed <= 0:
+                return True
             
+            # Only torrents the client knows about can have their data removed
+            candidates = (t for t in self.repository.iter_evictable() if t.info_hash)
+            to_evict = self.eviction_planner.plan(candidates, space_needed)
+        freed = sum(t.size for t in to_evict)
+        
+        if freed < space_needed:
+            logging.debug(
+                f"→ Only {freed / (1024**3):.2f} of {space_needed / (1024**3):.2f} GB "
+                f"can be freed, keeping completed torrents"
+            )
+            return False
+        
+        # Delete torrents and their data in one client call
+        with self._client_call('remove_torrents'):
+            removed = self.torrent_client.remove_torrents([t.info_hash for t in to_evict], delete_files=True)
+        if not removed:
+            self.notify(ErrorEvent(f"Failed to remove {len(to_evict)} torrents from client"))
+            return False
+        
+        for torrent in to_evict:
             # Mark as deleted in repository
             torrent.status = TorrentStatus.DELETED
             self.repository.update(torrent)
             
-            self.notify('torrent_deleted', {
-                'title': torrent.title,
-                'size_mb': torrent.size / (1024**2)
-            })
+            self.notify(TorrentDeleted(torrent.title, torrent.size / (1024**2)))
+        self.storage_manager.record_removed(freed)
+        return True
+    
+    def submit_torrents(self, torrents: List[Torrent]) -> List[Torrent]:
+        """Add a batch of torrents in one client call
+        
+        The torrents must be in the outbox and space must already have been
+        freed with cleanup_storage. Returns the torrents the client accepted.
+        """
+        if not torrents:
+            return []
+        
+        # Add torrents to client
+        download_path = self.config.snapshot.storage.download_path
+        with self._client_call('add_torrents'):
+            results = self.torrent_client.add_torrents(
+                [t.link for t in torrents], download_path, [client_tag(t.id) for t in torrents]
+            )
+        
+        with self.state_lock:
+            return self._record_added(torrents, results)
+    
+    def _record_added(self, torrents: List[Torrent], results: List[Optional[bool]]) -> List[Torrent]:
+        """Move accepted torrents out of the outbox, schedule retries for the rest"""
+        added = []
+        self.metrics.counter('torrents_added_total', 'Torrents the client accepted').inc(results.count(True))
+        self.metrics.counter('torrents_failed_total', 'Torrent adds the client rejected').inc(
+            results.count(False)
+        )
+        
+        # Not the torrents' fault, so no attempt is counted
+        unreachable = [t for t, success in zip(torrents, results) if success is None]
+        if unreachable:
+            delay = self.outbox.mark_unreachable(unreachable)
+            self.notify(ErrorEvent(
+                f"Torrent client unreachable, {len(unreachable)} torrents kept in the outbox "
+                f"for another try in {delay:.0f} seconds"
+            ))
+        
+        for torrent, success in zip(torrents, results):
+            if success is None:
+                continue
+            if success:
+                self.outbox.mark_submitted(torrent)
+                self.storage_manager.reserve(torrent)
+                
+                self.notify(TorrentAdded(torrent.title, torrent.size / (1024**2), torrent.category))
+                
+                added.append(torrent)
+            elif self.outbox.mark_failed(torrent):
+                self.notify(ErrorEvent(
+                    f"Failed to add torrent: {torrent.title} (attempt {torrent.attempts}, will retry)"
+                ))
+            else:
+                self.notify(ErrorEvent(
+                    f"Giving up on torrent after {torrent.attempts} attempts: {torrent.title}"
+                ))
+        return added
     
     def process_feed(self):
         """Process RSS feed and download freeleech torrents"""
+        # All repository changes of a cycle go to disk in one write
+        with self.profiler.cycle():
+            with self.metrics.timer('cycle_seconds', 'Duration of a whole feed check'):
+                with self.repository.batch():
+                    self._process_feed()
+                    with self.metrics.timer('repository_write_seconds', 'Time to write a cycle of repository changes'):
+                        self.repository.flush()
+        self._record_metrics()
+        self.memory_tracker.cycle_finished()
+    
+    def _process_feed(self):
+        """Run one feed check"""
         logging.info("=" * 70)
         logging.info("Starting FileList RSS check...")
         
-        # Fetch RSS feed
-        entries = self.rss_parser.fetch_entries()
-        
-        if not entries:
-            logging.warning("No entries found in RSS feed")
-            return
-        
-        # Count freeleech torrents
-        freeleech_count = sum(1 for e in entries if '[FreeLeech]' in e.get('title', ''))
+        # Refresh torrent states so completed torrents can be evicted
+        self.sync_client_state()
         
-        self.notify('feed_check', {
-            'total': len(entries),
-            'freeleech': freeleech_count
-        })
+        # Fetch, parse, plan and submit concurrently
+        cycle = FeedCycle(self, self.feed_poller.due_feeds())
+        self.pipeline_stats = cycle.run()
+        for stats in self.pipeline_stats.values():
+            logging.debug(f"Stage {stats}")
+        self._record_cycle_metrics(cycle.results)
         
-        # Track downloads this run
-        downloaded_count = 0
-        
-        # Process each entry
-        for entry in entries:
-            # Stop if we've reached the limit
-            if downloaded_count >= self.max_torrents_per_run:
-                logging.info(f"✓ Reached limit of {self.max_torrents_per_run} torrents per run")
-                break
+        for result in cycle.results:
+            feed = result.feed
+            for torrent_id in result.rejected_ids:
+                self.seen_index.reject(feed.parser.feed_key, torrent_id)
             
-            torrent = self.rss_parser.parse_entry(entry)
-            if not torrent:
+            if feed.parser.not_modified:
+                logging.info(f"→ Feed {feed.name} not modified since last check")
                 continue
-            
-            # Check if should download
-            if not self.should_download(torrent):
+            if result.total == 0:
+                logging.warning(f"No entries found in RSS feed {feed.name}")
                 continue
             
-            # Check if we need to cleanup before downloading
-            self.cleanup_storage(required_space=torrent.size)
-            
-            # Add torrent to client
-            download_path = self.config.get('storage.download_path')
-            if self.torrent_client.add_torrent(torrent.link, download_path):
-                torrent.status = TorrentStatus.DOWNLOADING
-                self.repository.add(torrent)
-                
-                self.notify('torrent_added', {
-                    'title': torrent.title,
-                    'size_mb': torrent.size / (1024**2),
-                    'category': torrent.category
-                })
-                
-                downloaded_count += 1
-            else:
-                self.notify('error', {
-                    'message': f"Failed to add torrent: {torrent.title}"
-                })
+            self.notify(FeedChecked(
+                feed.name, result.total, len(result.parsed),
+                sum(1 for t in result.parsed if t.is_freeleech)
+            ))
+        
+        if len(cycle.candidates) >= self.max_torrents_per_run:
+            logging.info(f"✓ Reached limit of {self.max_torrents_per_run} torrents per run")
         
-        if downloaded_count == 0:
+        if not cycle.added:
             logging.info("→ No new torrents to download")
         
+        if cycle.deferred:
+            self.notify(ErrorEvent(
+                f"Not enough space for {len(cycle.deferred)} torrents, "
+                f"kept in the outbox until downloads complete"
+            ))
+        
+        pending = len(self.outbox)
+        if pending:
+            logging.info(f"→ {pending} torrents waiting in the outbox for the client")
+        
+        # Only skip this version of a feed once every entry was handled;
+        # entries left over by the limit are read again. Failed adds stay in
+        # the outbox, so they do not hold the feed back
+        for result in cycle.results:
+            if result.complete and result.total:
+                self.seen_index.advance_poll_mark(result.feed.parser.feed_key, result.newest_id)
+                result.feed.parser.commit()
+        self.feed_poller.schedule(cycle.results)
+        self.seen_index.save()
+        
         # Show storage status
         usage = self.storage_manager.get_usage_percent()
         logging.info(f"→ Storage usage: {usage:.1f}%")
         
+        # Batching notifiers send what this check collected
+        self.notify(CycleFinished(len(cycle.added), len(self.outbox)))
+        
         logging.info("✓ RSS check completed")
         logging.info("=" * 70)
     
+    def _record_cycle_metrics(self, results):
+        """Record per-feed and per-stage numbers of a finished cycle"""
+        metrics = self.metrics
+        fetch = metrics.histogram('feed_fetch_seconds', 'Time to read one feed')
+        entries = metrics.counter('feed_entries_total', 'Feed entries read')
+        new = metrics.counter('feed_new_entries_total', 'Feed entries not seen before')
+        failures = metrics.counter('feed_errors_total', 'Failed feed reads')
+        for result in results:
+            feed = result.feed.name
+            fetch.observe(result.duration, feed=feed)
+            entries.inc(result.total, feed=feed)
+            new.inc(len(result.parsed), feed=feed)
+            if result.feed.parser.failed:
+                failures.inc(feed=feed)
+        
+        busy = metrics.counter('pipeline_stage_busy_seconds_total', 'Time pipeline stages spent working')
+        items = metrics.counter('pipeline_stage_items_total', 'Items pipeline stages handled')
+        errors = metrics.counter('pipeline_stage_errors_total', 'Items pipeline stages failed on')
+        for stats in self.pipeline_stats.values():
+            busy.inc(stats.busy_seconds, stage=stats.name)
+            items.inc(stats.items_in, stage=stats.name)
+            errors.inc(stats.errors, stage=stats.name)
+    
+    def _record_metrics(self):
+        """Update gauges and save a snapshot for --stats"""
+        metrics = self.metrics
+        metrics.counter('cycles_total', 'Feed checks run').inc()
+        metrics.gauge('storage_used_bytes', 'Bytes used in the download folder').set(
+            self.storage_manager.get_folder_size()
+        )
+        metrics.gauge('storage_limit_bytes', 'Configured download folder limit').set(
+            self.storage_manager.max_size_bytes
+        )
+        metrics.gauge('outbox_pending', 'Torrents waiting to be added to the client').set(len(self.outbox))
+        metrics.gauge('torrents_tracked', 'Torrents in the repository').set(len(self.repository.torrents))
+        if self._event_bus is not None:
+            metrics.gauge('events_queued', 'Events waiting for slow observers').set(len(self._event_bus))
+            metrics.gauge('events_dropped', 'Events dropped because the queue was full').set(
+                self._event_bus.dropped
+            )
+        if not self.metrics_file:
+            return
+        try:
+            save_snapshot(metrics.snapshot(), self.metrics_file)
+        except OSError as e:
+            logging.error(f"Failed to save metrics: {e}")
+    
     def run(self):
         """Main run loop"""
-        check_interval = self.config.get('filelist.check_interval', 300)
+        scheduler = self.feed_poller.scheduler
         
         logging.info("=" * 70)
         logging.info("FileList RSS Handler Started")
         logging.info("=" * 70)
-        logging.info(f"RSS URL: {self.config.rss_feed_url[:50]}...")
-        logging.info(f"Check interval: {check_interval} seconds ({check_interval//60} minutes)")
+        for feed in self.feed_poller.feeds:
+            logging.info(f"RSS feed {feed.name}: {feed.parser.feed_url[:50]}... every {feed.interval} seconds")
+        if isinstance(scheduler, AdaptivePollScheduler):
+            logging.info(f"Adaptive polling between {scheduler.min_interval} and {scheduler.max_interval} seconds")
         logging.info(f"Max storage: {self.config.get('storage.max_size_gb')} GB")
         logging.info(f"Freeleech only: {self.config.get('filters.freeleech_only')}")
         logging.info(f"Torrents per run: {self.max_torrents_per_run}")
         logging.info(f"Download path: {self.config.get('storage.download_path')}")
         logging.info("=" * 70)
         
+        self._install_signal_handlers()
+        if self.config.get('metrics.enabled', True):
+            MetricsServer(
+                self.metrics,
+                self.config.get('metrics.host', '127.0.0.1'),
+                self.config.get('metrics.port', 9108)
+            ).start()
+        
         try:
             while True:
                 try:
+                    self.reload_config()
                     self.process_feed()
+                    delay = self.feed_poller.seconds_until_due()
+                    # Wake up early for torrents waiting to be retried
+                    retry_delay = self.outbox.seconds_until_due()
+                    if retry_delay is not None:
+                        delay = min(delay, retry_delay)
                 except Exception as e:
-                    self.notify('error', {'message': str(e)})
+                    self.metrics.counter('cycle_errors_total', 'Feed checks that failed').inc()
+                    self.notify(ErrorEvent(str(e)))
                     logging.exception("Error processing feed")
+                    # Feeds may not have been rescheduled, don't spin; a
+                    # reload may have replaced them since startup
+                    delay = max(self.feed_poller.seconds_until_due(),
+                                min(feed.interval for feed in self.feed_poller.feeds))
                 
-                logging.info(f"\n💤 Sleeping for {check_interval} seconds...\n")
-                time.sleep(check_interval)
+                logging.info(f"\n💤 Sleeping for {delay:.0f} seconds...\n")
+                time.sleep(delay)
         except KeyboardInterrupt:
             logging.info("\n👋 Shutting down gracefully...")
+            self.stop_event_bus()
@@ -0,0 +1,10 @@
+"""Instrumentation: counters, latency histograms and their exposition"""
+
+from .registry import MetricsRegistry, Counter, Gauge, Histogram, LATENCY_BUCKETS
+from .exposition import render_prometheus, format_stats, save_snapshot, load_snapshot
+from .server import MetricsServer
+
+__all__ = [
+    'MetricsRegistry', 'Counter', 'Gauge', 'Histogram', 'LATENCY_BUCKETS',
+    'render_prometheus', 'format_stats', 'save_snapshot', 'load_snapshot', 'MetricsServer',
+]
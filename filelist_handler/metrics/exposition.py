@@ -0,0 +1,106 @@
+"""Rendering metric snapshots for Prometheus and for people"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _label_text(labels: Dict[str, str], extra: Optional[Dict[str, str]] = None) -> str:
+    labels = {**labels, **(extra or {})}
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + '}'
+
+
+def _number(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus(snapshot: dict) -> str:
+    """Prometheus text exposition format (version 0.0.4)"""
+    lines = []
+    for name, metric in sorted(snapshot['metrics'].items()):
+        if metric['help']:
+            lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for sample in metric['samples']:
+            labels = sample['labels']
+            if metric['type'] != 'histogram':
+                lines.append(f"{name}{_label_text(labels)} {_number(sample['value'])}")
+                continue
+            for bound, count in sample['buckets']:
+                lines.append(f"{name}_bucket{_label_text(labels, {'le': _number(bound)})} {count}")
+            lines.append(f"{name}_bucket{_label_text(labels, {'le': '+Inf'})} {sample['count']}")
+            lines.append(f"{name}_sum{_label_text(labels)} {_number(sample['sum'])}")
+            lines.append(f"{name}_count{_label_text(labels)} {sample['count']}")
+    return '\n'.join(lines) + '\n'
+
+
+def quantile(sample: dict, q: float) -> float:
+    """Estimate a quantile of a histogram sample from its buckets"""
+    count = sample['count']
+    if not count:
+        return 0.0
+    rank = q * count
+    lower, below = 0.0, 0
+    for bound, cumulative in sample['buckets']:
+        if cumulative >= rank:
+            # Assume observations are spread evenly within the bucket
+            inside = cumulative - below
+            return lower + (bound - lower) * ((rank - below) / inside if inside else 0)
+        lower, below = bound, cumulative
+    # Beyond the largest bound
+    return lower
+
+
+def format_stats(snapshot: dict) -> str:
+    """Readable summary for the --stats command"""
+    lines: List[str] = []
+    counters, timings = [], []
+    for name, metric in sorted(snapshot['metrics'].items()):
+        for sample in metric['samples']:
+            label = name + _label_text(sample['labels'])
+            if metric['type'] == 'histogram':
+                timings.append((label, sample))
+            else:
+                counters.append((label, sample['value']))
+    
+    if timings:
+        width = max(len(label) for label, _ in timings)
+        lines.append(f"{'Latency':<{width}}  {'count':>8} {'mean':>10} {'p50':>10} {'p95':>10} {'p99':>10}")
+        for label, sample in timings:
+            mean = sample['sum'] / sample['count'] if sample['count'] else 0.0
+            cells = ' '.join(f"{v * 1000:>8.1f}ms" for v in (
+                mean, quantile(sample, 0.5), quantile(sample, 0.95), quantile(sample, 0.99)
+            ))
+            lines.append(f"{label:<{width}}  {sample['count']:>8} {cells}")
+    if counters:
+        if lines:
+            lines.append('')
+        width = max(len(label) for label, _ in counters)
+        lines.append('Counters')
+        for label, value in counters:
+            text = f"{value:.0f}" if value == int(value) else f"{value:.4f}"
+            lines.append(f"{label:<{width}}  {text}")
+    return '\n'.join(lines) if lines else 'No metrics recorded yet'
+
+
+def save_snapshot(snapshot: dict, path: str):
+    """Write a snapshot atomically so readers never see half a file"""
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(snapshot, f)
+    os.replace(tmp, path)
+
+
+def load_snapshot(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
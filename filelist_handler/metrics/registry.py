@@ -0,0 +1,149 @@
+"""Counters, gauges and latency histograms"""
+
+import time
+import bisect
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+# Upper bounds in seconds, from a fast parse to a stalled tracker
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Metric(ABC):
+    """A named metric with one series per label set"""
+    
+    kind = 'untyped'
+    
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._lock = threading.Lock()
+    
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {'type': self.kind, 'help': self.help, 'samples': self._samples()}
+    
+    @abstractmethod
+    def _samples(self) -> List[dict]:
+        """One entry per series, called with the lock held"""
+        pass
+
+
+class Counter(Metric):
+    """Value that only goes up"""
+    
+    kind = 'counter'
+    
+    def __init__(self, name: str, help_text: str):
+        super().__init__(name, help_text)
+        self._values: Dict[Labels, float] = {}
+    
+    def inc(self, amount: float = 1, **labels):
+        key = _labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def _samples(self) -> List[dict]:
+        return [{'labels': dict(k), 'value': v} for k, v in self._values.items()]
+
+
+class Gauge(Counter):
+    """Value that is set to the current reading"""
+    
+    kind = 'gauge'
+    
+    def set(self, value: float, **labels):
+        key = _labels(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(Metric):
+    """Counts of observations per upper bound, with their sum"""
+    
+    kind = 'histogram'
+    
+    def __init__(self, name: str, help_text: str, buckets=LATENCY_BUCKETS):
+        super().__init__(name, help_text)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Labels, list] = {}  # labels -> [bucket counts, sum, count]
+    
+    def observe(self, value: float, **labels):
+        key = _labels(labels)
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            if i < len(self.buckets):
+                series[0][i] += 1
+            series[1] += value
+            series[2] += 1
+    
+    def _samples(self) -> List[dict]:
+        samples = []
+        for key, (counts, total, count) in self._series.items():
+            # Exposed cumulatively, as Prometheus expects
+            cumulative, running = [], 0
+            for bound, n in zip(self.buckets, counts):
+                running += n
+                cumulative.append([bound, running])
+            samples.append({'labels': dict(key), 'buckets': cumulative, 'sum': total, 'count': count})
+        return samples
+
+
+class MetricsRegistry:
+    """Holds the metrics of the process, safe to update from any thread"""
+    
+    def __init__(self, prefix: str = 'filelist'):
+        self.prefix = prefix
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+    
+    def _get(self, cls, name: str, help_text: str, **kwargs) -> Metric:
+        name = f"{self.prefix}_{name}" if self.prefix else name
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = self._metrics[name] = cls(name, help_text, **kwargs)
+        return metric
+    
+    def counter(self, name: str, help_text: str = '') -> Counter:
+        return self._get(Counter, name, help_text)
+    
+    def gauge(self, name: str, help_text: str = '') -> Gauge:
+        return self._get(Gauge, name, help_text)
+    
+    def histogram(self, name: str, help_text: str = '', buckets=LATENCY_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, help_text, buckets=buckets)
+    
+    @contextmanager
+    def timer(self, name: str, help_text: str = '', **labels):
+        """Observe how long the block took, also when it raises"""
+        histogram = self.histogram(name, help_text)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            histogram.observe(time.perf_counter() - start, **labels)
+    
+    def snapshot(self, now: Optional[float] = None) -> dict:
+        """Current values of all metrics as plain data"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {
+            'time': time.time() if now is None else now,
+            'metrics': {metric.name: metric.snapshot() for metric in metrics},
+        }
@@ -0,0 +1,57 @@
+"""Local HTTP endpoint serving metrics in Prometheus text format"""
+
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from .registry import MetricsRegistry
+from .exposition import render_prometheus
+
+
+class MetricsServer:
+    """Serves ``/metrics`` from a background thread
+    
+    Binds to localhost by default; a port that cannot be bound is logged
+    and the handler keeps running without the endpoint.
+    """
+    
+    def __init__(self, registry: MetricsRegistry, host: str = '127.0.0.1', port: int = 9108):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+    
+    def start(self) -> bool:
+        registry = self.registry
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = render_prometheus(registry.snapshot()).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args):
+                pass
+        
+        try:
+            self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        except OSError as e:
+            logging.error(f"✗ Could not serve metrics on {self.host}:{self.port}: {e}")
+            return False
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name='metrics', daemon=True).start()
+        logging.info(f"✓ Serving metrics on http://{self.host}:{self.port}/metrics")
+        return True
+    
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -1,9 +1,9 @@
 """Torrent data model"""
 
-from dataclasses import dataclass, asdict
+import sys
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 
 
 class TorrentStatus(Enum):
@@ -15,33 +15,132 @@ class TorrentStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+_STATUS_BY_VALUE = {status.value: status for status in TorrentStatus}
+
+
+def _to_epoch(value: Union[None, int, float, str, datetime]) -> Optional[int]:
+    """Convert a stored date (epoch seconds or legacy ISO string) to epoch seconds"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        return int(value)
+    except ValueError:
+        return int(datetime.fromisoformat(value).timestamp())
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
 class Torrent:
-    """Torrent data model"""
-    id: str
-    title: str
-    link: str
-    size: int  # bytes
-    is_freeleech: bool
-    added_date: datetime
-    completed_date: Optional[datetime] = None
-    status: TorrentStatus = TorrentStatus.PENDING
-    category: Optional[str] = None
-    seeders: int = 0
+    """Torrent data model
+    
+    Slotted to keep the per-record footprint small: dates are held as epoch
+    seconds (exposed as datetimes through properties) and categories are
+    interned, since a few dozen distinct values repeat across all records.
+    """
+    
+    __slots__ = (
+        'id', 'title', 'link', 'size', 'is_freeleech', 'added_ts',
+        'completed_ts', 'status', 'category', 'seeders', 'leechers', 'info_hash',
+        'attempts', 'retry_ts',
+    )
+    
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        link: str,
+        size: int,  # bytes
+        is_freeleech: bool,
+        added_date: Union[datetime, int],
+        completed_date: Union[datetime, int, None] = None,
+        status: TorrentStatus = TorrentStatus.PENDING,
+        category: Optional[str] = None,
+        seeders: int = 0,
+        leechers: int = 0,
+        info_hash: Optional[str] = None,  # set once the client reports it
+        attempts: int = 0,  # submissions to the client so far
+        retry_at: Union[datetime, int, None] = None,  # next submission while PENDING
+    ):
+        self.id = id
+        self.title = title
+        self.link = link
+        self.size = size
+        self.is_freeleech = is_freeleech
+        self.added_ts = _to_epoch(added_date)
+        self.completed_ts = _to_epoch(completed_date)
+        self.status = status
+        self.category = _intern(category)
+        self.seeders = seeders
+        self.leechers = leechers
+        self.info_hash = info_hash
+        self.attempts = attempts
+        self.retry_ts = _to_epoch(retry_at)
+    
+    @property
+    def added_date(self) -> datetime:
+        return datetime.fromtimestamp(self.added_ts)
+    
+    @added_date.setter
+    def added_date(self, value: Union[datetime, int]):
+        self.added_ts = _to_epoch(value)
+    
+    @property
+    def completed_date(self) -> Optional[datetime]:
+        return datetime.fromtimestamp(self.completed_ts) if self.completed_ts is not None else None
+    
+    @completed_date.setter
+    def completed_date(self, value: Union[datetime, int, None]):
+        self.completed_ts = _to_epoch(value)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Torrent):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    def __repr__(self) -> str:
+        return f"Torrent(id={self.id!r}, title={self.title!r}, status={self.status.value})"
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
-        data = asdict(self)
-        data['added_date'] = self.added_date.isoformat()
-        data['completed_date'] = self.completed_date.isoformat() if self.completed_date else None
-        data['status'] = self.status.value
-        return data
+        return {
+            'id': self.id,
+            'title': self.title,
+            'link': self.link,
+            'size': self.size,
+            'is_freeleech': self.is_freeleech,
+            'added_date': self.added_ts,
+            'completed_date': self.completed_ts,
+            'status': self.status.value,
+            'category': self.category,
+            'seeders': self.seeders,
+            'leechers': self.leechers,
+            'info_hash': self.info_hash,
+            'attempts': self.attempts,
+            'retry_at': self.retry_ts,
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Torrent':
-        """Create from dictionary"""
-        data['added_date'] = datetime.fromisoformat(data['added_date'])
-        data['completed_date'] = datetime.fromisoformat(data['completed_date']) if data['completed_date'] else None
-        data['status'] = TorrentStatus(data['status'])
-        return cls(**data)
-
+        """Create from dictionary (accepts epoch or legacy ISO dates)"""
+        torrent = cls.__new__(cls)
+        torrent.id = data['id']
+        torrent.title = data['title']
+        torrent.link = data['link']
+        torrent.size = data['size']
+        torrent.is_freeleech = bool(data['is_freeleech'])
+        torrent.added_ts = _to_epoch(data['added_date'])
+        torrent.completed_ts = _to_epoch(data.get('completed_date'))
+        torrent.status = _STATUS_BY_VALUE[data['status']]
+        torrent.category = _intern(data.get('category'))
+        torrent.seeders = data.get('seeders') or 0
+        torrent.leechers = data.get('leechers') or 0
+        torrent.info_hash = data.get('info_hash')
+        torrent.attempts = data.get('attempts') or 0
+        torrent.retry_ts = _to_epoch(data.get('retry_at'))
+        return torrent
@@ -1,7 +1,17 @@
 """Observer pattern implementation"""
 
-from .base import Observer, Subject
+from .base import Observer, BatchingObserver, Subject
+from .events import (
+    Event, TorrentAdded, TorrentCompleted, TorrentDeleted, StorageWarning,
+    ErrorEvent, FeedChecked, CycleFinished, GenericEvent, make_event
+)
+from .event_bus import EventBus
 from .logging_observer import LoggingObserver
+from .webhook_observer import WebhookObserver
 
-__all__ = ['Observer', 'Subject', 'LoggingObserver']
+__all__ = [
+    'Observer', 'BatchingObserver', 'Subject', 'EventBus', 'LoggingObserver', 'WebhookObserver',
+    'Event', 'TorrentAdded', 'TorrentCompleted', 'TorrentDeleted', 'StorageWarning',
+    'ErrorEvent', 'FeedChecked', 'CycleFinished', 'GenericEvent', 'make_event',
+]
 
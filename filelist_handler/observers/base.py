@@ -1,16 +1,60 @@
 """Base observer pattern classes"""
 
+import logging
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Union
+from .events import Event, make_event
+from .event_bus import EventBus
 
 
 class Observer(ABC):
-    """Abstract observer for event notifications"""
+    """Abstract observer for event notifications
+    
+    Observers are called from the event bus worker, so they may do slow
+    I/O. Setting ``inline`` calls them right away in the notifying thread
+    instead, for cheap observers whose output must stay in order with it.
+    """
+    
+    inline = False
     
     @abstractmethod
     def update(self, event: str, data: dict):
         """Handle event notification"""
         pass
+    
+    def receive(self, event: Event):
+        """Handle a typed event, by default passed on to update"""
+        self.update(event.name, event.data)
+
+
+class BatchingObserver(Observer):
+    """Observer that handles the events of a whole check at once
+    
+    Events are collected until the check finishes or ``max_batch`` are
+    waiting, then passed to ``update_batch`` together.
+    """
+    
+    events: Optional[tuple] = None  # event names to collect, None for all
+    
+    def __init__(self, max_batch: int = 100):
+        self.max_batch = max_batch
+        self._batch: List[Event] = []
+    
+    def receive(self, event: Event):
+        finished = event.name == 'cycle_finished'
+        if not finished and (self.events is None or event.name in self.events):
+            self._batch.append(event)
+        if self._batch and (finished or len(self._batch) >= self.max_batch):
+            batch, self._batch = self._batch, []
+            self.update_batch(batch)
+    
+    def update(self, event: str, data: dict):
+        self.receive(make_event(event, data))
+    
+    @abstractmethod
+    def update_batch(self, events: List[Event]):
+        """Handle the collected events"""
+        pass
 
 
 class Subject:
@@ -18,6 +62,7 @@ class Subject:
     
     def __init__(self):
         self._observers: List[Observer] = []
+        self._event_bus: Optional[EventBus] = None
     
     def attach(self, observer: Observer):
         """Attach an observer"""
@@ -29,8 +74,41 @@ class Subject:
         if observer in self._observers:
             self._observers.remove(observer)
     
-    def notify(self, event: str, data: dict):
+    def start_event_bus(self, maxsize: int = 1000, policy: str = 'drop_new',
+                        block_timeout: float = 1.0) -> EventBus:
+        """Deliver to observers that are not inline from a worker thread"""
+        if self._event_bus is None:
+            self._event_bus = EventBus(self._deliver, maxsize, policy, block_timeout)
+        return self._event_bus
+    
+    def stop_event_bus(self, timeout: float = 5.0):
+        """Deliver queued events and stop the worker"""
+        if self._event_bus is not None:
+            self._event_bus.close(timeout)
+            self._event_bus = None
+    
+    def notify(self, event: Union[Event, str], data: Optional[dict] = None):
         """Notify all observers"""
-        for observer in self._observers:
-            observer.update(event, data)
-
+        if isinstance(event, str):
+            event = make_event(event, data or {})
+        queued = False
+        for observer in list(self._observers):
+            if observer.inline or self._event_bus is None:
+                self._deliver_to(observer, event)
+            elif not queued:
+                self._event_bus.publish(event)
+                queued = True
+    
+    def _deliver(self, event: Event):
+        """Deliver a queued event, runs on the event bus worker"""
+        for observer in list(self._observers):
+            if not observer.inline:
+                self._deliver_to(observer, event)
+    
+    @staticmethod
+    def _deliver_to(observer: Observer, event: Event):
+        # One failing observer must not keep the event from the others
+        try:
+            observer.receive(event)
+        except Exception:
+            logging.exception(f"Observer {type(observer).__name__} failed on {event.name}")
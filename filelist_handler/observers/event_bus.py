@@ -0,0 +1,95 @@
+"""Queue of events delivered to observers from a worker thread"""
+
+import time
+import queue
+import logging
+import threading
+from typing import Callable
+from .events import Event
+
+# Tells the worker to exit
+_STOP = object()
+
+POLICIES = ('drop_new', 'drop_oldest', 'block')
+
+
+class EventBus:
+    """Decouples publishing events from delivering them
+    
+    ``publish`` only enqueues, so a slow observer never holds up the
+    caller. When the queue is full the ``policy`` decides: 'drop_new'
+    discards the new event, 'drop_oldest' makes room by discarding the
+    oldest queued one, and 'block' waits up to ``block_timeout`` seconds
+    for room before dropping. Dropped events are counted.
+    """
+    
+    def __init__(self, deliver: Callable[[Event], None], maxsize: int = 1000,
+                 policy: str = 'drop_new', block_timeout: float = 1.0):
+        if policy not in POLICIES:
+            logging.warning(f"Unknown event queue policy '{policy}', using drop_new")
+            policy = 'drop_new'
+        self.deliver = deliver
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._thread = threading.Thread(target=self._run, name='event-bus', daemon=True)
+        self._thread.start()
+    
+    def __len__(self) -> int:
+        return self._queue.qsize()
+    
+    def publish(self, event: Event) -> bool:
+        """Queue an event, returns False when it was dropped"""
+        try:
+            if self.policy == 'block':
+                self._queue.put(event, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(event)
+            return True
+        except queue.Full:
+            pass
+        
+        if self.policy == 'drop_oldest':
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self.dropped += 1
+                self._queue.put_nowait(event)
+                return True
+            except (queue.Empty, queue.Full):
+                pass
+        self.dropped += 1
+        return False
+    
+    def _run(self):
+        while True:
+            event = self._queue.get()
+            try:
+                if event is _STOP:
+                    return
+                self.deliver(event)
+            except Exception:
+                logging.exception(f"Failed to deliver event {event.name}")
+            finally:
+                self._queue.task_done()
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until queued events were delivered, False on timeout"""
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+    
+    def close(self, timeout: float = 5.0):
+        """Deliver what is queued and stop the worker"""
+        self.flush(timeout)
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
@@ -0,0 +1,130 @@
+"""Typed events sent to observers"""
+
+import time
+from typing import Dict, Optional, Type
+
+
+class Event:
+    """Something that happened, with a name and typed fields
+    
+    Observers that work with plain dicts get ``name`` and ``data``.
+    """
+    
+    __slots__ = ('timestamp',)
+    name = 'event'
+    
+    def __init__(self):
+        self.timestamp = time.time()
+    
+    @property
+    def data(self) -> dict:
+        return {field: getattr(self, field) for field in type(self).__slots__}
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.data})"
+
+
+class TorrentAdded(Event):
+    __slots__ = ('title', 'size_mb', 'category')
+    name = 'torrent_added'
+    
+    def __init__(self, title: str, size_mb: float, category: Optional[str] = None):
+        super().__init__()
+        self.title = title
+        self.size_mb = size_mb
+        self.category = category
+
+
+class TorrentCompleted(Event):
+    __slots__ = ('title',)
+    name = 'torrent_completed'
+    
+    def __init__(self, title: str):
+        super().__init__()
+        self.title = title
+
+
+class TorrentDeleted(Event):
+    __slots__ = ('title', 'size_mb')
+    name = 'torrent_deleted'
+    
+    def __init__(self, title: str, size_mb: float):
+        super().__init__()
+        self.title = title
+        self.size_mb = size_mb
+
+
+class StorageWarning(Event):
+    __slots__ = ('usage_percent',)
+    name = 'storage_warning'
+    
+    def __init__(self, usage_percent: float):
+        super().__init__()
+        self.usage_percent = usage_percent
+
+
+class ErrorEvent(Event):
+    __slots__ = ('message',)
+    name = 'error'
+    
+    def __init__(self, message: str):
+        super().__init__()
+        self.message = message
+
+
+class FeedChecked(Event):
+    __slots__ = ('feed', 'total', 'new', 'freeleech')
+    name = 'feed_check'
+    
+    def __init__(self, feed: str, total: int, new: int, freeleech: int):
+        super().__init__()
+        self.feed = feed
+        self.total = total
+        self.new = new
+        self.freeleech = freeleech
+
+
+class CycleFinished(Event):
+    """End of a feed check, batching observers send what they collected"""
+    
+    __slots__ = ('added', 'pending')
+    name = 'cycle_finished'
+    
+    def __init__(self, added: int, pending: int):
+        super().__init__()
+        self.added = added
+        self.pending = pending
+
+
+class GenericEvent(Event):
+    """Event without a class of its own"""
+    
+    __slots__ = ('name', '_data')
+    
+    def __init__(self, name: str, data: dict):
+        super().__init__()
+        self.name = name
+        self._data = data
+    
+    @property
+    def data(self) -> dict:
+        return self._data
+
+
+EVENT_TYPES: Dict[str, Type[Event]] = {
+    cls.name: cls for cls in (
+        TorrentAdded, TorrentCompleted, TorrentDeleted, StorageWarning,
+        ErrorEvent, FeedChecked, CycleFinished,
+    )
+}
+
+
+def make_event(name: str, data: dict) -> Event:
+    """Build the typed event for a name and dict payload"""
+    cls = EVENT_TYPES.get(name)
+    if cls is not None:
+        try:
+            return cls(**data)
+        except TypeError:
+            pass
+    return GenericEvent(name, data)
@@ -7,6 +7,9 @@ from .base import Observer
 class LoggingObserver(Observer):
     """Observer that logs events"""
     
+    # Cheap, and its lines must stay in order with the handler's own
+    inline = True
+    
     def __init__(self):
         self.logger = logging.getLogger('FileListHandler')
     
@@ -23,5 +26,9 @@ class LoggingObserver(Observer):
         elif event == 'error':
             self.logger.error(f"✗ Error: {data['message']}")
         elif event == 'feed_check':
-            self.logger.info(f"→ Checking feed... Found {data['total']} entries, {data['freeleech']} freeleech")
+            feed = f" {data['feed']}" if data.get('feed') else ''
+            self.logger.info(
+                f"→ Checking feed{feed}... Found {data['total']} entries, "
+                f"{data.get('new', data['total'])} new ({data['freeleech']} freeleech)"
+            )
 
@@ -0,0 +1,48 @@
+"""Webhook observer implementation"""
+
+import logging
+from typing import List, Optional, Sequence
+import requests
+from .base import BatchingObserver
+from .events import Event
+
+
+class WebhookObserver(BatchingObserver):
+    """Posts the events of each check to a webhook as one JSON message
+    
+    The body has a ``text`` summary, which chat webhooks show as is, and
+    the typed ``events`` for anything that wants the details.
+    """
+    
+    def __init__(self, url: str, session: Optional[requests.Session] = None,
+                 events: Sequence[str] = ('torrent_added', 'torrent_deleted', 'error'),
+                 max_batch: int = 50):
+        super().__init__(max_batch)
+        self.url = url
+        self.session = session or requests.Session()
+        self.events = tuple(events)
+    
+    def update_batch(self, events: List[Event]):
+        """Send the collected events in one request"""
+        payload = {
+            'text': '\n'.join(self._summary(event) for event in events),
+            'events': [{'event': event.name, 'time': event.timestamp, **event.data} for event in events],
+        }
+        try:
+            response = self.session.post(self.url, json=payload)
+            response.raise_for_status()
+        except Exception as e:
+            logging.error(f"✗ Failed to send {len(events)} events to webhook: {e}")
+    
+    @staticmethod
+    def _summary(event: Event) -> str:
+        data = event.data
+        if event.name == 'torrent_added':
+            return f"✓ Added: {data['title']} ({data['size_mb']:.2f} MB)"
+        if event.name == 'torrent_completed':
+            return f"✓ Completed: {data['title']}"
+        if event.name == 'torrent_deleted':
+            return f"✗ Deleted: {data['title']} (freed {data['size_mb']:.2f} MB)"
+        if event.name == 'error':
+            return f"✗ Error: {data['message']}"
+        return f"→ {event.name}: {data}"
@@ -1,6 +1,10 @@
 """RSS feed parsers"""
 
 from .rss_parser import RSSFeedParser
+from .feed_poller import FeedPoller, FeedSource, FeedResult
+from .poll_scheduler import PollScheduler, AdaptivePollScheduler
 
-__all__ = ['RSSFeedParser']
-
+__all__ = [
+    'RSSFeedParser', 'FeedPoller', 'FeedSource', 'FeedResult',
+    'PollScheduler', 'AdaptivePollScheduler',
+]
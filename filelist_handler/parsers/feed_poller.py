@@ -0,0 +1,177 @@
+"""Concurrent polling of several RSS feeds"""
+
+import time
+import asyncio
+import logging
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from ..models import Torrent
+from ..transport import HttpTransport
+from .rss_parser import RSSFeedParser
+from .poll_scheduler import PollScheduler
+
+
+class FeedSource:
+    """One configured feed with its own filters and interval"""
+    
+    def __init__(self, name: str, parser: RSSFeedParser, interval: float, filters: Dict):
+        self.name = name
+        self.parser = parser
+        self.base_interval = interval  # as configured
+        self.interval = interval  # current, set by the scheduler
+        self.filters = filters
+        self.next_due = 0.0  # monotonic time of the next poll
+        self.last_started: Optional[float] = None
+        self.arrival_rate: Optional[float] = None  # new IDs per second
+        self.errors = 0  # consecutive failed polls
+    
+    def is_due(self, now: float) -> bool:
+        return now >= self.next_due
+
+
+class FeedResult:
+    """What one poll of one feed produced"""
+    
+    def __init__(self, feed: FeedSource):
+        self.feed = feed
+        self.total = 0
+        self.parsed: List[Torrent] = []
+        self.candidates: List[Torrent] = []
+        self.rejected_ids: List[str] = []
+        self.newest_id = 0
+        self.reached_limit = False
+        self.started = 0.0  # monotonic time the poll began
+        self.duration = 0.0  # seconds spent reading the feed
+    
+    @property
+    def complete(self) -> bool:
+        """Whether every entry read up to the poll mark was handled"""
+        return not self.reached_limit and not self.feed.parser.failed
+
+
+class FeedPoller:
+    """Reads several feeds at once on an asyncio event loop
+    
+    Feed reads are blocking streamed requests, so each one runs in a worker
+    thread while the event loop waits for all of them. All feeds share one
+    requests.Session, which keeps a connection pool per host.
+    """
+    
+    def __init__(self, feeds: List[FeedSource], scheduler: Optional[PollScheduler] = None,
+                 session: Optional[requests.Session] = None):
+        self.feeds = feeds
+        self.scheduler = scheduler or PollScheduler()
+        if session is None:
+            # Feeds usually share a host, so the pool must fit all of them
+            session = HttpTransport(pool_size=max(1, len(feeds))).session
+        self.session = session
+        for feed in feeds:
+            feed.parser.session = self.session
+        self._workers = max(1, len(feeds))
+        self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix='feed')
+    
+    def update_feeds(self, feeds: List[FeedSource]):
+        """Switch to a new feed list, feeds with the same name and URL keep their poll state"""
+        current = {(feed.name, feed.parser.feed_url): feed for feed in self.feeds}
+        updated = []
+        for feed in feeds:
+            kept = current.get((feed.name, feed.parser.feed_url))
+            if kept is None:
+                feed.parser.session = self.session
+                updated.append(feed)
+                continue
+            kept.filters = feed.filters
+            if kept.base_interval != feed.base_interval:
+                # Adaptive scheduling moves on from here at the next poll
+                kept.base_interval = kept.interval = feed.base_interval
+                if kept.last_started is not None:
+                    kept.next_due = min(kept.next_due, kept.last_started + kept.interval)
+            updated.append(kept)
+        self.feeds = updated
+        
+        if len(updated) > self._workers:
+            self._executor.shutdown(wait=False)
+            self._workers = len(updated)
+            self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix='feed')
+    
+    def due_feeds(self, now: Optional[float] = None) -> List[FeedSource]:
+        """Feeds whose interval has elapsed"""
+        now = time.monotonic() if now is None else now
+        return [feed for feed in self.feeds if feed.is_due(now)]
+    
+    def seconds_until_due(self, now: Optional[float] = None) -> float:
+        """Time left until the next feed is due"""
+        now = time.monotonic() if now is None else now
+        return max(0.0, min(feed.next_due for feed in self.feeds) - now)
+    
+    def poll(self, feeds: List[FeedSource], seen, emit: Callable[[Tuple[FeedResult, dict]], None],
+             stop: Optional[threading.Event] = None) -> List[FeedResult]:
+        """Read the given feeds concurrently, results keep the feed order
+        
+        Unseen entries are passed to ``emit`` as ``(result, entry)`` while
+        the feeds are still being read; setting ``stop`` ends all reads.
+        """
+        if not feeds:
+            return []
+        stop = stop or threading.Event()
+        started = time.monotonic()
+        results = asyncio.run(self._poll(feeds, seen, emit, stop))
+        for result in results:
+            result.started = started
+        return results
+    
+    def schedule(self, results: List[FeedResult]):
+        """Set the next poll of each feed once its entries were handled"""
+        for result in results:
+            self.scheduler.schedule(result, result.started)
+    
+    async def _poll(self, feeds, seen, emit, stop) -> List[FeedResult]:
+        loop = asyncio.get_running_loop()
+        tasks = [
+            loop.run_in_executor(self._executor, self.fetch, feed, seen, emit, stop)
+            for feed in feeds
+        ]
+        return list(await asyncio.gather(*tasks))
+    
+    @staticmethod
+    def fetch(feed: FeedSource, seen, emit: Callable[[Tuple[FeedResult, dict]], None],
+              stop: threading.Event) -> FeedResult:
+        """Stream one feed and emit the entries not handled before
+        
+        Only reads the seen index, so feeds can be fetched in parallel.
+        """
+        result = FeedResult(feed)
+        start = time.perf_counter()
+        parser = feed.parser
+        poll_mark = seen.get_poll_mark(parser.feed_key)
+        entries = parser.stream_entries()
+        try:
+            for entry in entries:
+                if stop.is_set():
+                    # Entries from here on are left for the next poll
+                    result.reached_limit = True
+                    break
+                result.total += 1
+                entry_id = parser.entry_id(entry)
+                if entry_id is not None:
+                    result.newest_id = max(result.newest_id, int(entry_id))
+                    # Everything from here on was handled by an earlier poll
+                    if int(entry_id) <= poll_mark:
+                        break
+                    # Skip entries handled in previous polls without parsing them
+                    if seen.skips(parser.feed_key, entry_id):
+                        continue
+                emit((result, entry))
+        except Exception as e:
+            parser.failed = True
+            logging.error(f"Failed to read feed {feed.name}: {e}")
+        finally:
+            entries.close()
+            result.duration = time.perf_counter() - start
+        return result
+    
+    def close(self):
+        """Shut down worker threads"""
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,80 @@
+"""Scheduling of feed polls"""
+
+import random
+import logging
+from typing import Optional
+
+
+class PollScheduler:
+    """Polls each feed at its configured interval (Strategy Pattern)
+    
+    Deadlines are counted from when a poll started on the monotonic clock,
+    so the time a poll takes does not push later polls back. Failed polls
+    back off exponentially, and every delay is jittered so several feeds
+    on one tracker do not line up.
+    """
+    
+    def __init__(self, jitter: float = 0.1, retry_delay: float = 60, max_backoff: float = 3600):
+        self.jitter = jitter
+        self.retry_delay = retry_delay
+        self.max_backoff = max_backoff
+        self._random = random.Random()
+    
+    def schedule(self, result, started: float):
+        """Set the feed's next deadline from the poll that began at ``started``"""
+        feed = result.feed
+        elapsed = started - feed.last_started if feed.last_started is not None else None
+        feed.last_started = started
+        
+        if feed.parser.failed:
+            feed.errors += 1
+            delay = min(self.max_backoff, self.retry_delay * 2 ** (feed.errors - 1))
+            logging.warning(f"Feed {feed.name} failed {feed.errors} time(s), retrying in {delay:.0f} seconds")
+        else:
+            feed.errors = 0
+            feed.interval = self.next_interval(feed, result, elapsed)
+            delay = feed.interval
+        
+        feed.next_due = started + delay * self._random.uniform(1 - self.jitter, 1 + self.jitter)
+    
+    def next_interval(self, feed, result, elapsed: Optional[float]) -> float:
+        """Interval to use after a successful poll"""
+        return feed.base_interval
+
+
+class AdaptivePollScheduler(PollScheduler):
+    """Follows the rate at which new entries show up in a feed
+    
+    Keeps a moving average of new IDs per second and polls about once per
+    ``target_new`` arrivals. A poll that finds something worth downloading
+    drops straight to the minimum interval, since releases tend to come in
+    bursts; quiet polls pull the average down and the interval stretches
+    back towards the maximum.
+    """
+    
+    def __init__(self, min_interval: float = 30, max_interval: float = 900,
+                 jitter: float = 0.1, retry_delay: float = 60, max_backoff: float = 3600,
+                 target_new: float = 1.0, smoothing: float = 0.3):
+        super().__init__(jitter, retry_delay, max_backoff)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_new = target_new
+        self.smoothing = smoothing
+    
+    def next_interval(self, feed, result, elapsed: Optional[float]) -> float:
+        if elapsed is None or elapsed <= 0:
+            # First poll, the feed's backlog says nothing about its rate
+            return max(self.min_interval, min(self.max_interval, feed.base_interval))
+        
+        sample = len(result.parsed) / elapsed
+        if feed.arrival_rate is None:
+            feed.arrival_rate = sample
+        else:
+            feed.arrival_rate += self.smoothing * (sample - feed.arrival_rate)
+        
+        if result.candidates:
+            return self.min_interval
+        if feed.arrival_rate <= 0:
+            return self.max_interval
+        interval = self.target_new / feed.arrival_rate
+        return max(self.min_interval, min(self.max_interval, interval))
@@ -1,44 +1,217 @@
 """FileList RSS feed parser"""
 
 import re
+import json
+import time
+import hashlib
 import logging
-import feedparser
-from datetime import datetime
-from typing import List, Optional
+import requests
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
 from ..models import Torrent
+from ..transport import HttpTransport
+
+# Link format: https://filelist.io/download.php?id=946514&passkey=...
+ID_PATTERN = re.compile(r'id=(\d+)')
+
+FREELEECH_PATTERN = re.compile(r'\[freeleech\]', re.IGNORECASE)
+
+# Description format: "Category: Filme HD\nSize: 32.21 GB\nSeeders: 12\nLeechers: 3"
+# The usual layout is read with one anchored match, anything else falls back
+# to searching each field on its own
+DESCRIPTION_PATTERN = re.compile(
+    r'\s*Category:\s*(?P<category>[^\n<|]+?)\s*(?:\n|<br\s*/?>|\|)'
+    r'\s*Size:\s*(?P<size>\d+(?:\.\d+)?)\s*(?P<unit>[KMGT]B)'
+    r'(?:.*?Seeders:\s*(?P<seeders>\d+))?'
+    r'(?:.*?Leechers:\s*(?P<leechers>\d+))?',
+    re.IGNORECASE | re.DOTALL
+)
+CATEGORY_PATTERN = re.compile(r'Category:\s*([^\n<|]+?)\s*(?=$|[\n<|]|\s[A-Z][a-z]+:)')
+SIZE_PATTERN = re.compile(r'Size:\s*(\d+(?:\.\d+)?)\s*([KMGT]B)', re.IGNORECASE)
+SEEDERS_PATTERN = re.compile(r'Seeders:\s*(\d+)', re.IGNORECASE)
+LEECHERS_PATTERN = re.compile(r'Leechers:\s*(\d+)', re.IGNORECASE)
+
+SIZE_MULTIPLIERS = {
+    'KB': 1024,
+    'MB': 1024**2,
+    'GB': 1024**3,
+    'TB': 1024**4
+}
+
+
+def parse_description(description: str) -> Tuple[int, Optional[str], int, int]:
+    """Extract size (bytes), category, seeders and leechers from a description"""
+    match = DESCRIPTION_PATTERN.match(description)
+    if match:
+        category, size, unit, seeders, leechers = match.group(
+            'category', 'size', 'unit', 'seeders', 'leechers'
+        )
+        return (
+            int(float(size) * SIZE_MULTIPLIERS[unit.upper()]),
+            category,
+            int(seeders) if seeders else 0,
+            int(leechers) if leechers else 0,
+        )
+    
+    match = SIZE_PATTERN.search(description)
+    size = int(float(match.group(1)) * SIZE_MULTIPLIERS[match.group(2).upper()]) if match else 0
+    
+    match = CATEGORY_PATTERN.search(description)
+    category = match.group(1) if match else None
+    
+    match = SEEDERS_PATTERN.search(description)
+    seeders = int(match.group(1)) if match else 0
+    
+    match = LEECHERS_PATTERN.search(description)
+    leechers = int(match.group(1)) if match else 0
+    return size, category, seeders, leechers
 
 
 class RSSFeedParser:
     """Parser for FileList RSS feeds"""
     
-    def __init__(self, feed_url: str):
+    def __init__(self, feed_url: str, cache_path: Optional[str] = None,
+                 session: Optional[requests.Session] = None):
         self.feed_url = feed_url
+        self.cache_path = Path(cache_path) if cache_path else None
+        # Cache entries are keyed by a hash so the passkey never hits the disk
+        self.feed_key = hashlib.sha1(feed_url.encode()).hexdigest()
+        self.etag: Optional[str] = None
+        self.modified: Optional[str] = None
+        self.not_modified = False
+        self.failed = False
+        self._pending: Optional[Dict[str, Optional[str]]] = None
+        self.session = session or HttpTransport().session
+        self._load_validators()
     
-    def fetch_entries(self) -> List[dict]:
-        """Fetch and parse RSS feed entries"""
+    def _conditional_headers(self) -> Dict[str, str]:
+        """Validators of the last processed response"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.modified:
+            headers['If-Modified-Since'] = self.modified
+        return headers
+    
+    def stream_entries(self, chunk_size: int = 8192) -> Iterator[dict]:
+        """Fetch the feed and yield entries while it is still downloading
+        
+        Uses an incremental XML pull parser, so the caller can stop early
+        and the rest of the feed is never read or parsed. Entries are plain
+        dicts with ``title``, ``link``, ``description`` and ``published``.
+        
+        Sends the validators of the last processed response, so an unchanged
+        feed is answered with 304 and yields nothing.
+        """
+        self.not_modified = False
+        self.failed = False
+        self._pending = None
         try:
-            feed = feedparser.parse(self.feed_url)
-            return feed.entries
+            response = self.session.get(
+                self.feed_url, headers=self._conditional_headers(), stream=True
+            )
         except Exception as e:
+            self.failed = True
             logging.error(f"Failed to fetch RSS feed: {e}")
-            return []
+            return
+        
+        with response:
+            if response.status_code == 304:
+                self.not_modified = True
+                return
+            if response.status_code != 200:
+                self.failed = True
+                logging.error(f"Failed to fetch RSS feed: HTTP {response.status_code}")
+                return
+            
+            validators = {
+                'etag': response.headers.get('ETag'),
+                'modified': response.headers.get('Last-Modified'),
+            }
+            parser = ET.XMLPullParser(events=('end',))
+            try:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    parser.feed(chunk)
+                    for _, elem in parser.read_events():
+                        if elem.tag != 'item':
+                            continue
+                        entry = {
+                            'title': elem.findtext('title', ''),
+                            'link': elem.findtext('link', ''),
+                            'description': elem.findtext('description', ''),
+                            'published': elem.findtext('pubDate', ''),
+                        }
+                        elem.clear()
+                        # Validators become committable once entries arrive
+                        self._pending = validators
+                        yield entry
+            except (ET.ParseError, requests.RequestException) as e:
+                self.failed = True
+                self._pending = None
+                logging.error(f"Failed to read RSS feed: {e}")
+    
+    @staticmethod
+    def entry_id(entry: dict) -> Optional[str]:
+        """Extract torrent ID straight from the raw entry link"""
+        match = ID_PATTERN.search(entry.get('link', ''))
+        return match.group(1) if match else None
     
-    def parse_entry(self, entry: dict) -> Optional[Torrent]:
+    def commit(self):
+        """Remember validators of the last fetched feed once it was processed"""
+        if self._pending is None:
+            return
+        self.etag = self._pending['etag']
+        self.modified = self._pending['modified']
+        self._pending = None
+        self._save_validators()
+    
+    def _load_validators(self):
+        """Load validators persisted by a previous run"""
+        if not self.cache_path or not self.cache_path.exists():
+            return
+        try:
+            with open(self.cache_path, 'r') as f:
+                cached = json.load(f).get(self.feed_key, {})
+            self.etag = cached.get('etag')
+            self.modified = cached.get('modified')
+        except Exception as e:
+            logging.warning(f"Failed to load feed cache: {e}")
+    
+    def _save_validators(self):
+        """Persist validators so a restart does not force a full fetch"""
+        if not self.cache_path:
+            return
+        try:
+            data = {}
+            if self.cache_path.exists():
+                with open(self.cache_path, 'r') as f:
+                    data = json.load(f)
+            data[self.feed_key] = {'etag': self.etag, 'modified': self.modified}
+            tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + '.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            tmp_path.replace(self.cache_path)
+        except Exception as e:
+            logging.warning(f"Failed to save feed cache: {e}")
+    
+    def parse_entries(self, entries: List[dict]) -> List[Torrent]:
+        """Parse many RSS entries, skipping the ones that fail"""
+        now = int(time.time())
+        torrents = []
+        for entry in entries:
+            torrent = self.parse_entry(entry, now)
+            if torrent:
+                torrents.append(torrent)
+        return torrents
+    
+    def parse_entry(self, entry: dict, now: Optional[int] = None) -> Optional[Torrent]:
         """Parse RSS entry into Torrent object"""
         try:
             # Extract basic information
-            title = entry.get('title', '')
-            link = entry.get('link', '')
-            description = entry.get('description', '')
-            
-            # Check if freeleech (must have [FreeLeech] in title)
-            is_freeleech = '[FreeLeech]' in title or '[FREELEECH]' in title.upper()
-            
-            # Extract size from description
-            size_bytes = self._extract_size(description)
-            
-            # Extract category from description
-            category = self._extract_category(description)
+            title = entry.get('title') or ''
+            link = entry.get('link') or ''
+            description = entry.get('description') or entry.get('summary') or ''
             
             # Extract torrent ID from link
             torrent_id = self._extract_id(link)
@@ -47,15 +220,19 @@ class RSSFeedParser:
                 logging.warning(f"Could not extract ID from: {link}")
                 return None
             
+            size_bytes, category, seeders, leechers = parse_description(description)
+            
             return Torrent(
                 id=torrent_id,
                 title=title,
                 link=link,
                 size=size_bytes,
-                is_freeleech=is_freeleech,
-                added_date=datetime.now(),
+                # Check if freeleech (must have [FreeLeech] in title)
+                is_freeleech=FREELEECH_PATTERN.search(title) is not None,
+                added_date=now or int(time.time()),
                 category=category,
-                seeders=0
+                seeders=seeders,
+                leechers=leechers
             )
         except Exception as e:
             logging.error(f"Failed to parse entry: {e}")
@@ -63,34 +240,5 @@ class RSSFeedParser:
     
     def _extract_id(self, link: str) -> Optional[str]:
         """Extract torrent ID from download link"""
-        # Link format: https://filelist.io/download.php?id=946514&passkey=...
-        match = re.search(r'id=(\d+)', link)
+        match = ID_PATTERN.search(link)
         return match.group(1) if match else None
-    
-    def _extract_size(self, description: str) -> int:
-        """Extract size from description (in bytes)"""
-        # Description format: "Category: ... Size: 32.21 GB ..."
-        size_pattern = r'Size:\s*(\d+(?:\.\d+)?)\s*(GB|MB|KB|TB)'
-        match = re.search(size_pattern, description, re.IGNORECASE)
-        
-        if match:
-            value = float(match.group(1))
-            unit = match.group(2).upper()
-            
-            multipliers = {
-                'KB': 1024,
-                'MB': 1024**2,
-                'GB': 1024**3,
-                'TB': 1024**4
-            }
-            return int(value * multipliers.get(unit, 1))
-        
-        return 0  # Unknown size
-    
-    def _extract_category(self, description: str) -> Optional[str]:
-        """Extract category from description"""
-        # Description format: "Category: Filme HD ..."
-        category_pattern = r'Category:\s*([^\n]+)'
-        match = re.search(category_pattern, description)
-        return match.group(1).strip() if match else None
-
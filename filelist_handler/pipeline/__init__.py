@@ -0,0 +1,6 @@
+"""Staged processing of a feed check"""
+
+from .stages import Pipeline, Stage, StageStats
+from .feed_cycle import FeedCycle
+
+__all__ = ['Pipeline', 'Stage', 'StageStats', 'FeedCycle']
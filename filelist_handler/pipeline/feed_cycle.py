@@ -0,0 +1,158 @@
+"""One feed check run as a pipeline"""
+
+import time
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional
+from ..models import Torrent
+from ..parsers import FeedResult, FeedSource
+from .stages import Pipeline, Stage, StageStats
+
+
+def _age(entry: dict) -> Optional[float]:
+    """Seconds since an entry was posted, from its RSS pubDate"""
+    published = entry.get('published')
+    if not published:
+        return None
+    try:
+        return time.time() - parsedate_to_datetime(published).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class FeedCycle:
+    """Feed check split into fetch, parse, plan and submit stages
+    
+    Feed reads, parsing and client calls overlap: the first wanted entry is
+    on its way to the client while the feeds are still being read, and a
+    slow client only fills the queues in front of it. Once the per-run
+    limit is reached the feeds stop being read. Outbox torrents due for
+    another attempt go through the same plan and submit stages.
+    
+    With a selector, eligible torrents are held back until every feed was
+    read, and only the set the selector picks within the storage budget
+    and the per-run limit moves on; the others are left for a later poll.
+    """
+    
+    def __init__(self, handler, feeds: List[FeedSource], queue_size: int = 64):
+        self.handler = handler
+        self.feeds = feeds
+        self.limit = handler.max_torrents_per_run
+        self.stop = threading.Event()
+        self.results: List[FeedResult] = []
+        self.candidates: List[Torrent] = []
+        self.source: Dict[str, FeedResult] = {}  # eligible ID -> feed result
+        self.selector = handler.selector
+        self.eligible: List[Torrent] = []
+        self.ages: Dict[str, float] = {}  # seconds since posted, when known
+        self.added: List[Torrent] = []
+        self.deferred: List[Torrent] = []  # left in the outbox for lack of space
+        self.retries: List[Torrent] = handler.outbox.due()
+        self.reserved = 0  # bytes planned for but not submitted yet
+        self.pipeline = Pipeline([
+            Stage('fetch', self.fetch),
+            Stage('parse', self.parse, finish=self.select if self.selector else None),
+            Stage('plan', self.plan),
+            # A slow client gets everything that queued up in one call
+            Stage('submit', self.submit, batch_size=max(1, self.limit)),
+        ], queue_size, thread_context=handler.profiler.thread)
+    
+    def run(self) -> Dict[str, StageStats]:
+        """Run the check and return per-stage counters"""
+        return self.pipeline.run()
+    
+    def fetch(self, _, emit):
+        """Stream all feeds, emitting unseen entries"""
+        for torrent in self.retries:
+            emit((None, torrent))
+        self.results = self.handler.feed_poller.poll(
+            self.feeds, self.handler.seen_index, emit, self.stop
+        )
+    
+    def parse(self, item, emit):
+        """Parse and filter one entry, emitting wanted torrents"""
+        result, entry = item
+        if result is None:
+            # Outbox retry, parsed in an earlier check
+            emit(entry)
+            return
+        if len(self.candidates) >= self.limit:
+            # Read before the limit stopped the feeds, left for the next poll
+            result.reached_limit = True
+            return
+        
+        feed = result.feed
+        metrics = self.handler.metrics
+        with metrics.timer('parse_seconds', 'Time to parse one feed entry'):
+            torrent = feed.parser.parse_entry(entry)
+        # The first feed listing an ID wins
+        if not torrent or torrent.id in self.source:
+            return
+        result.parsed.append(torrent)
+        
+        with metrics.timer('filter_seconds', 'Time to apply the download filters to one torrent'):
+            wanted = self.handler.should_download(torrent, feed.filters)
+        if not wanted:
+            result.rejected_ids.append(torrent.id)
+            return
+        self.source[torrent.id] = result
+        
+        if self.selector is not None:
+            self.eligible.append(torrent)
+            age = _age(entry)
+            if age is not None:
+                self.ages[torrent.id] = age
+            return
+        
+        self._choose(torrent, emit)
+        if len(self.candidates) >= self.limit:
+            self.stop.set()
+    
+    def select(self, emit):
+        """Pass on the most valuable set of eligible torrents"""
+        with self.handler.state_lock:
+            budget = self.handler.download_budget() - sum(t.size for t in self.retries)
+        chosen = self.selector.select(self.eligible, budget, self.limit, self.ages)
+        
+        # Torrents not picked this time stay unseen and the feed is read
+        # again from its old poll mark, as with entries left by the limit
+        chosen_ids = {t.id for t in chosen}
+        for torrent in self.eligible:
+            if torrent.id not in chosen_ids:
+                self.source[torrent.id].reached_limit = True
+        for torrent in chosen:
+            self._choose(torrent, emit)
+    
+    def _choose(self, torrent: Torrent, emit):
+        self.source[torrent.id].candidates.append(torrent)
+        self.candidates.append(torrent)
+        emit(torrent)
+    
+    def plan(self, torrent: Torrent, emit):
+        """Free space for a torrent, counting those still queued for the client
+        
+        A torrent that does not fit stays PENDING in the outbox and is
+        planned again on the next check.
+        """
+        with self.handler.state_lock:
+            if not self.handler.repository.exists(torrent.id):
+                # Kept from here on, even if the client turns out to be down
+                self.handler.outbox.enqueue(torrent)
+                self.handler.seen_index.add(torrent.id)
+            if not self.handler.cleanup_storage(required_space=self.reserved + torrent.size):
+                self.handler.outbox.defer(torrent)
+                self.deferred.append(torrent)
+                return
+            self.reserved += torrent.size
+        emit(torrent)
+    
+    def submit(self, torrents: List[Torrent], emit):
+        """Add queued torrents to the client in one call"""
+        try:
+            added = self.handler.submit_torrents(torrents)
+        finally:
+            with self.handler.state_lock:
+                self.reserved -= sum(t.size for t in torrents)
+        self.added.extend(added)
+        for torrent in added:
+            emit(torrent)
@@ -0,0 +1,161 @@
+"""Pipeline of stages joined by bounded queues"""
+
+import time
+import queue
+import logging
+import threading
+from contextlib import AbstractContextManager, ExitStack
+from typing import Any, Callable, Dict, List, Optional
+
+# Marks the end of a stage's input
+_DONE = object()
+
+Emit = Callable[[Any], None]
+
+
+class StageStats:
+    """Throughput and latency counters of one stage"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.max_latency = 0.0
+    
+    def record(self, seconds: float, items: int):
+        self.calls += 1
+        self.items_in += items
+        self.busy_seconds += seconds
+        if seconds > self.max_latency:
+            self.max_latency = seconds
+    
+    @property
+    def mean_latency(self) -> float:
+        """Average seconds per call"""
+        return self.busy_seconds / self.calls if self.calls else 0.0
+    
+    @property
+    def throughput(self) -> float:
+        """Items handled or produced per busy second"""
+        items = max(self.items_in, self.items_out)
+        return items / self.busy_seconds if self.busy_seconds else 0.0
+    
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.items_in} in, {self.items_out} out, "
+            f"{self.mean_latency * 1000:.1f} ms avg, {self.max_latency * 1000:.1f} ms max, "
+            f"{self.throughput:.0f}/s"
+            + (f", {self.errors} errors" if self.errors else "")
+        )
+
+
+class Stage:
+    """One step of a pipeline, run on its own thread
+    
+    The handler is called as ``handler(item, emit)`` and passes results to
+    the next stage through ``emit``. With a ``batch_size`` the handler
+    always gets a list of whatever was queued, up to that many items, so
+    a slow stage catches up by working on larger batches. ``finish(emit)``
+    runs once all input was handled, for stages that hold items back.
+    """
+    
+    def __init__(self, name: str, handler: Callable[[Any, Emit], None],
+                 batch_size: Optional[int] = None,
+                 finish: Optional[Callable[[Emit], None]] = None):
+        self.name = name
+        self.handler = handler
+        self.batch_size = batch_size
+        self.finish = finish
+        self.stats = StageStats(name)
+    
+    def run(self, inbox: queue.Queue, outbox: queue.Queue = None):
+        """Handle items until the end marker, then pass the marker on"""
+        def emit(item):
+            self.stats.items_out += 1
+            if outbox is not None:
+                # Blocks while the next stage is behind
+                outbox.put(item)
+        
+        done = False
+        while not done:
+            item = inbox.get()
+            if item is _DONE:
+                break
+            batch = [item]
+            while self.batch_size is not None and len(batch) < self.batch_size:
+                try:
+                    item = inbox.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _DONE:
+                    done = True
+                    break
+                batch.append(item)
+            
+            start = time.perf_counter()
+            try:
+                self.handler(batch if self.batch_size is not None else batch[0], emit)
+            except Exception:
+                self.stats.errors += 1
+                logging.exception(f"Pipeline stage {self.name} failed")
+            self.stats.record(time.perf_counter() - start, len(batch))
+        
+        if self.finish is not None:
+            start = time.perf_counter()
+            try:
+                self.finish(emit)
+            except Exception:
+                self.stats.errors += 1
+                logging.exception(f"Pipeline stage {self.name} failed to finish")
+            self.stats.record(time.perf_counter() - start, 0)
+        
+        if outbox is not None:
+            outbox.put(_DONE)
+
+
+class Pipeline:
+    """Runs stages concurrently, each feeding the next through a bounded queue
+    
+    The first stage is the source: its handler is called once with ``None``
+    and emits the items that flow through the rest of the pipeline.
+    Each stage thread runs inside ``thread_context()`` when one is given.
+    """
+    
+    def __init__(self, stages: List[Stage], maxsize: int = 64,
+                 thread_context: Optional[Callable[[], AbstractContextManager]] = None):
+        self.stages = stages
+        self.maxsize = maxsize
+        self.thread_context = thread_context
+    
+    def run(self) -> Dict[str, StageStats]:
+        """Run all stages to completion and return their counters"""
+        queues = [queue.Queue(self.maxsize) for _ in self.stages]
+        queues[0].put(None)
+        queues[0].put(_DONE)
+        
+        threads = []
+        for i, stage in enumerate(self.stages):
+            outbox = queues[i + 1] if i + 1 < len(self.stages) else None
+            thread = threading.Thread(
+                target=self._run_stage, args=(stage, queues[i], outbox),
+                name=f"pipeline-{stage.name}", daemon=True
+            )
+            thread.start()
+            threads.append(thread)
+        
+        for thread in threads:
+            thread.join()
+        return {stage.name: stage.stats for stage in self.stages}
+    
+    def _run_stage(self, stage: Stage, inbox: queue.Queue, outbox: Optional[queue.Queue]):
+        with ExitStack() as stack:
+            if self.thread_context is not None:
+                # The stage must still run and pass the end marker on
+                try:
+                    stack.enter_context(self.thread_context())
+                except Exception:
+                    logging.exception(f"Pipeline stage {stage.name} runs without its thread context")
+            stage.run(inbox, outbox)
@@ -0,0 +1,6 @@
+"""Ranking and selection of download candidates"""
+
+from .scoring import ValueScorer
+from .knapsack import KnapsackSelector
+
+__all__ = ['ValueScorer', 'KnapsackSelector']
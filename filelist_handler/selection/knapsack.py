@@ -0,0 +1,64 @@
+"""Choosing the set of candidates to download"""
+
+from typing import Dict, List, Optional
+from ..models import Torrent
+from .scoring import ValueScorer
+
+
+class KnapsackSelector:
+    """Picks the candidates worth most in total within a byte budget and a count
+    
+    Solves a 0/1 knapsack with an extra limit on the number of items by
+    dynamic programming. Sizes are rounded up to ``budget / resolution``
+    byte units, so the table stays small and the chosen set never goes
+    over budget; the cost is O(candidates * quota * resolution).
+    Candidates whose size the feed did not give fill the quota left over,
+    best score first, as their cost cannot be planned for.
+    """
+    
+    def __init__(self, scorer: ValueScorer, resolution: int = 1000):
+        self.scorer = scorer
+        self.resolution = resolution
+    
+    def select(self, candidates: List[Torrent], budget: int, quota: int,
+               ages: Optional[Dict[str, float]] = None) -> List[Torrent]:
+        """Return the chosen candidates, highest value per GB first"""
+        ages = ages or {}
+        if quota <= 0:
+            return []
+        unknown = [t for t in candidates if t.size <= 0]
+        unknown.sort(key=lambda t: self.scorer.score(t, ages.get(t.id, 0.0)), reverse=True)
+        items = [t for t in candidates if 0 < t.size <= budget]
+        if not items:
+            return unknown[:quota]
+        
+        unit = max(1, -(-budget // self.resolution))
+        capacity = budget // unit
+        weights = [-(-t.size // unit) for t in items]
+        values = [self.scorer.value(t, ages.get(t.id, 0.0)) for t in items]
+        
+        # best[k][c]: highest value using at most k items and c units
+        best = [[0.0] * (capacity + 1) for _ in range(quota + 1)]
+        taken = []
+        for weight, value in zip(weights, values):
+            took = [bytearray(capacity + 1) for _ in range(quota + 1)]
+            for k in range(quota, 0, -1):
+                row, prev = best[k], best[k - 1]
+                for c in range(capacity, weight - 1, -1):
+                    candidate = prev[c - weight] + value
+                    if candidate > row[c]:
+                        row[c] = candidate
+                        took[k][c] = 1
+            taken.append(took)
+        
+        # Walk back through the decisions to recover the chosen set
+        chosen = []
+        k, c = quota, capacity
+        for i in range(len(items) - 1, -1, -1):
+            if k > 0 and taken[i][k][c]:
+                chosen.append(items[i])
+                c -= weights[i]
+                k -= 1
+        
+        chosen.sort(key=lambda t: self.scorer.score(t, ages.get(t.id, 0.0)), reverse=True)
+        return chosen + unknown[:quota - len(chosen)]
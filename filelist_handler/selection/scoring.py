@@ -0,0 +1,32 @@
+"""Upload value estimates for download candidates"""
+
+from typing import Dict, Optional
+from ..models import Torrent
+
+
+class ValueScorer:
+    """Estimates how much a torrent will upload per GB it occupies
+    
+    Demand is the leecher to seeder ratio of the swarm, weighted by
+    category and by a freeleech bonus (downloading it costs no ratio),
+    and halves every ``age_half_life`` seconds since the release was
+    posted, as swarms are busiest right after release.
+    """
+    
+    def __init__(self, category_weights: Optional[Dict[str, float]] = None,
+                 freeleech_bonus: float = 2.0, age_half_life: float = 86400):
+        self.category_weights = category_weights or {}
+        self.freeleech_bonus = freeleech_bonus
+        self.age_half_life = age_half_life
+    
+    def score(self, torrent: Torrent, age: float = 0.0) -> float:
+        """Expected upload value per GB, higher is better"""
+        demand = (torrent.leechers + 1) / (torrent.seeders + 1)
+        weight = self.category_weights.get(torrent.category, 1.0)
+        bonus = self.freeleech_bonus if torrent.is_freeleech else 1.0
+        freshness = 0.5 ** (max(0.0, age) / self.age_half_life)
+        return demand * weight * bonus * freshness
+    
+    def value(self, torrent: Torrent, age: float = 0.0) -> float:
+        """Expected upload value of the whole torrent"""
+        return self.score(torrent, age) * torrent.size / 1024**3
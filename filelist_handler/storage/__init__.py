@@ -2,6 +2,12 @@
 
 from .storage_manager import StorageManager
 from .repository import TorrentRepository
+from .usage_tracker import UsageTracker
+from .seen_index import SeenIndex
+from .eviction import EvictionPlanner
+from .outbox import SubmissionOutbox
 
-__all__ = ['StorageManager', 'TorrentRepository']
-
+__all__ = [
+    'StorageManager', 'TorrentRepository', 'UsageTracker', 'SeenIndex',
+    'EvictionPlanner', 'SubmissionOutbox',
+]
@@ -0,0 +1,35 @@
+"""Append-only archive for deleted torrents"""
+
+import os
+import json
+import logging
+from pathlib import Path
+from typing import Iterator, List
+
+
+class TorrentArchive:
+    """Cold storage for DELETED torrent records, one JSON object per line"""
+    
+    def __init__(self, path: str):
+        self.path = Path(path)
+    
+    def append(self, records: List[dict]):
+        """Durably append records to the archive"""
+        if not records:
+            return
+        with open(self.path, 'a') as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(',', ':')) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def __iter__(self) -> Iterator[dict]:
+        """Stream archived records from disk"""
+        if not self.path.exists():
+            return
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    logging.warning("Skipping incomplete torrent archive entry")
@@ -0,0 +1,243 @@
+"""Persistence backends for the torrent repository"""
+
+import os
+import json
+import sqlite3
+import logging
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable
+
+
+class StorageBackend(ABC):
+    """Abstract persistence backend (Strategy Pattern)"""
+    
+    @abstractmethod
+    def load(self) -> Dict[str, dict]:
+        """Load all records keyed by torrent ID"""
+        pass
+    
+    @abstractmethod
+    def write(self, upserts: Dict[str, dict], deletes: Iterable[str]):
+        """Durably apply a set of changes in one write"""
+        pass
+    
+    @abstractmethod
+    def snapshot(self, records: Dict[str, dict]):
+        """Replace the stored data with a full snapshot"""
+        pass
+    
+    @property
+    def needs_compaction(self) -> bool:
+        """Whether the caller should write a full snapshot"""
+        return False
+    
+    def close(self):
+        """Release resources held by the backend"""
+        pass
+
+
+def _write_json_atomic(path: Path, data: dict, indent=None):
+    """Write JSON to a temporary file and rename it over the target"""
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    tmp_path.replace(path)
+
+
+class JsonBackend(StorageBackend):
+    """Single JSON file rewritten on every change (legacy format)"""
+    
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._records: Dict[str, dict] = {}
+    
+    def load(self) -> Dict[str, dict]:
+        if self.path.exists():
+            with open(self.path, 'r') as f:
+                self._records = json.load(f)
+        return dict(self._records)
+    
+    def write(self, upserts: Dict[str, dict], deletes: Iterable[str]):
+        self._records.update(upserts)
+        for torrent_id in deletes:
+            self._records.pop(torrent_id, None)
+        _write_json_atomic(self.path, self._records, indent=2)
+    
+    def snapshot(self, records: Dict[str, dict]):
+        self._records = dict(records)
+        _write_json_atomic(self.path, self._records, indent=2)
+
+
+class JournalBackend(StorageBackend):
+    """JSON snapshot plus an append-only journal of changes
+    
+    Every write appends one line to ``<path>.journal`` and fsyncs it, so a
+    write costs O(changes) instead of O(all torrents). Once the journal holds
+    ``compact_every`` lines the repository folds it into a new snapshot. The
+    snapshot keeps the legacy ``torrents.json`` format, so existing databases
+    load as-is.
+    """
+    
+    def __init__(self, path: str, compact_every: int = 500):
+        self.path = Path(path)
+        self.journal_path = self.path.with_suffix(self.path.suffix + '.journal')
+        self.compact_every = compact_every
+        self._journal_lines = 0
+    
+    def load(self) -> Dict[str, dict]:
+        records = {}
+        if self.path.exists():
+            with open(self.path, 'r') as f:
+                records = json.load(f)
+        
+        self._journal_lines = 0
+        if self.journal_path.exists():
+            valid_bytes = 0
+            with open(self.journal_path, 'rb') as f:
+                for line in f:
+                    try:
+                        change = json.loads(line)
+                    except ValueError:
+                        change = None
+                    if change is None or not line.endswith(b'\n'):
+                        # Torn write from a crash, drop it so later appends replay
+                        logging.warning("Discarding incomplete torrent journal entry")
+                        break
+                    records.update(change.get('put', {}))
+                    for torrent_id in change.get('del', []):
+                        records.pop(torrent_id, None)
+                    self._journal_lines += 1
+                    valid_bytes += len(line)
+            if valid_bytes < self.journal_path.stat().st_size:
+                os.truncate(self.journal_path, valid_bytes)
+        return records
+    
+    def write(self, upserts: Dict[str, dict], deletes: Iterable[str]):
+        line = json.dumps({'put': upserts, 'del': list(deletes)}, separators=(',', ':'))
+        with open(self.journal_path, 'a') as f:
+            f.write(line + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_lines += 1
+    
+    @property
+    def needs_compaction(self) -> bool:
+        return self._journal_lines >= self.compact_every
+    
+    def snapshot(self, records: Dict[str, dict]):
+        _write_json_atomic(self.path, records, indent=2)
+        # Replaying the journal over the new snapshot is harmless, so a
+        # crash between these two steps does not lose anything
+        with open(self.journal_path, 'w'):
+            pass
+        self._journal_lines = 0
+
+
+class SQLiteBackend(StorageBackend):
+    """SQLite database with indexes on status and dates"""
+    
+    COLUMNS = (
+        'id', 'title', 'link', 'size', 'is_freeleech', 'added_date',
+        'completed_date', 'status', 'category', 'seeders',
+        'leechers', 'info_hash', 'attempts', 'retry_at',
+    )
+    
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS torrents (
+                id TEXT PRIMARY KEY,
+                title TEXT,
+                link TEXT,
+                size INTEGER,
+                is_freeleech INTEGER,
+                added_date INTEGER,
+                completed_date INTEGER,
+                status TEXT,
+                category TEXT,
+                seeders INTEGER,
+                leechers INTEGER,
+                info_hash TEXT,
+                attempts INTEGER,
+                retry_at INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS idx_torrents_status ON torrents(status);
+            CREATE INDEX IF NOT EXISTS idx_torrents_added ON torrents(added_date);
+            CREATE INDEX IF NOT EXISTS idx_torrents_completed ON torrents(completed_date);
+        ''')
+        # Add columns introduced after the database was created
+        existing = {row[1] for row in self.conn.execute('PRAGMA table_info(torrents)')}
+        for column in self.COLUMNS:
+            if column not in existing:
+                self.conn.execute(f'ALTER TABLE torrents ADD COLUMN {column}')
+        self.conn.commit()
+    
+    def is_empty(self) -> bool:
+        """Check if the database holds no torrents yet"""
+        return self.conn.execute('SELECT 1 FROM torrents LIMIT 1').fetchone() is None
+    
+    def load(self) -> Dict[str, dict]:
+        cursor = self.conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM torrents")
+        records = {}
+        for row in cursor:
+            record = dict(zip(self.COLUMNS, row))
+            record['is_freeleech'] = bool(record['is_freeleech'])
+            records[record['id']] = record
+        return records
+    
+    def _rows(self, records: Iterable[dict]):
+        for record in records:
+            yield tuple(record.get(column) for column in self.COLUMNS)
+    
+    def _upsert(self, records: Dict[str, dict]):
+        placeholders = ', '.join('?' for _ in self.COLUMNS)
+        self.conn.executemany(
+            f"INSERT OR REPLACE INTO torrents ({', '.join(self.COLUMNS)}) VALUES ({placeholders})",
+            self._rows(records.values())
+        )
+    
+    def write(self, upserts: Dict[str, dict], deletes: Iterable[str]):
+        with self.conn:
+            self._upsert(upserts)
+            self.conn.executemany(
+                'DELETE FROM torrents WHERE id = ?',
+                ((torrent_id,) for torrent_id in deletes)
+            )
+    
+    def snapshot(self, records: Dict[str, dict]):
+        # One transaction, so a failed insert never leaves the table empty
+        with self.conn:
+            self.conn.execute('DELETE FROM torrents')
+            self._upsert(records)
+    
+    def close(self):
+        self.conn.close()
+
+
+def create_backend(kind: str, db_path: str) -> StorageBackend:
+    """Create a backend, importing a legacy JSON database when needed"""
+    if kind == 'json':
+        return JsonBackend(db_path)
+    if kind == 'journal':
+        # The journal snapshot is the legacy JSON file itself
+        return JournalBackend(db_path)
+    if kind == 'sqlite':
+        legacy_path = Path(db_path)
+        sqlite_path = legacy_path.with_suffix('.db')
+        backend = SQLiteBackend(str(sqlite_path))
+        if legacy_path != sqlite_path and legacy_path.exists() and backend.is_empty():
+            legacy_backend = JournalBackend(db_path)
+            legacy = legacy_backend.load()
+            backend.write(legacy, [])
+            for path in (legacy_path, legacy_backend.journal_path):
+                if path.exists():
+                    path.rename(path.with_suffix(path.suffix + '.migrated'))
+            logging.info(f"✓ Migrated {len(legacy)} torrents from {legacy_path} to SQLite")
+        return backend
+    raise ValueError(f"Unknown storage backend: {kind}")
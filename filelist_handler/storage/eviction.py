@@ -0,0 +1,33 @@
+"""Eviction planning for the storage limit"""
+
+from typing import Iterable, List
+from ..models import Torrent
+
+
+class EvictionPlanner:
+    """Picks the torrents to delete to free a given amount of space"""
+    
+    def plan(self, candidates: Iterable[Torrent], space_needed: int) -> List[Torrent]:
+        """Select a minimal set of candidates covering space_needed
+        
+        Candidates are expected in eviction order (oldest first). They are
+        taken in that order until the space is covered, then any selected
+        torrent that is not needed to reach the target is dropped again,
+        newest first, so small late picks do not evict extra data.
+        """
+        if space_needed <= 0:
+            return []
+        
+        selected: List[Torrent] = []
+        freed = 0
+        for torrent in candidates:
+            if freed >= space_needed:
+                break
+            selected.append(torrent)
+            freed += torrent.size
+        
+        for torrent in reversed(selected[:-1]):
+            if freed - torrent.size >= space_needed:
+                selected.remove(torrent)
+                freed -= torrent.size
+        return selected
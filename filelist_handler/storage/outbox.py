@@ -0,0 +1,98 @@
+"""Durable queue of torrents waiting to be added to the client"""
+
+import time
+from typing import List, Optional
+from ..models import Torrent, TorrentStatus
+from .repository import TorrentRepository
+
+
+class SubmissionOutbox:
+    """PENDING torrents in the repository, retried with backoff
+    
+    A wanted torrent is stored as PENDING before it is sent to the client,
+    so a failed add is kept and retried on later checks instead of being
+    dropped. Each failure doubles the wait before the next attempt; after
+    ``max_attempts`` the torrent is marked ERROR. Only rejections by the
+    client count as attempts: while it cannot be reached, torrents wait
+    with the same doubling delay and keep their attempts.
+    """
+    
+    def __init__(self, repository: TorrentRepository, max_attempts: int = 5,
+                 retry_delay: int = 60, max_retry_delay: int = 3600):
+        self.repository = repository
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self._outages = 0  # submissions in a row that found the client down
+    
+    def __len__(self) -> int:
+        return len(self.repository.get_by_status(TorrentStatus.PENDING))
+    
+    def enqueue(self, torrent: Torrent):
+        """Store a torrent as waiting for submission"""
+        torrent.status = TorrentStatus.PENDING
+        torrent.attempts = 0
+        torrent.retry_ts = None
+        self.repository.add(torrent)
+    
+    def due(self, now: Optional[int] = None) -> List[Torrent]:
+        """PENDING torrents whose retry time has come, oldest first"""
+        now = int(time.time()) if now is None else now
+        pending = [
+            t for t in self.repository.get_by_status(TorrentStatus.PENDING)
+            if t.retry_ts is None or t.retry_ts <= now
+        ]
+        pending.sort(key=lambda t: t.added_ts)
+        return pending
+    
+    def seconds_until_due(self, now: Optional[int] = None) -> Optional[float]:
+        """Time left until the next retry, None when nothing is pending"""
+        now = int(time.time()) if now is None else now
+        pending = self.repository.get_by_status(TorrentStatus.PENDING)
+        if not pending:
+            return None
+        return max(0, min((t.retry_ts or now) - now for t in pending))
+    
+    def mark_submitted(self, torrent: Torrent):
+        """Record that the client accepted a torrent"""
+        torrent.status = TorrentStatus.DOWNLOADING
+        torrent.attempts += 1
+        torrent.retry_ts = None
+        self.repository.update(torrent)
+        self._outages = 0
+    
+    def defer(self, torrent: Torrent, now: Optional[int] = None):
+        """Try a torrent again later without counting an attempt"""
+        now = int(time.time()) if now is None else now
+        torrent.retry_ts = now + self.retry_delay
+        self.repository.update(torrent)
+    
+    def mark_failed(self, torrent: Torrent, now: Optional[int] = None) -> bool:
+        """Schedule a retry, returns False once the torrent was given up on"""
+        now = int(time.time()) if now is None else now
+        self._outages = 0
+        torrent.attempts += 1
+        if torrent.attempts >= self.max_attempts:
+            torrent.status = TorrentStatus.ERROR
+            torrent.retry_ts = None
+            self.repository.update(torrent)
+            return False
+        
+        delay = min(self.max_retry_delay, self.retry_delay * 2 ** (torrent.attempts - 1))
+        torrent.retry_ts = now + delay
+        self.repository.update(torrent)
+        return True
+    
+    def mark_unreachable(self, torrents: List[Torrent], now: Optional[int] = None) -> int:
+        """Schedule a retry for torrents the client could not be reached for
+        
+        Returns the delay, which doubles with each submission in a row that
+        found the client down.
+        """
+        now = int(time.time()) if now is None else now
+        self._outages += 1
+        delay = min(self.max_retry_delay, self.retry_delay * 2 ** (self._outages - 1))
+        for torrent in torrents:
+            torrent.retry_ts = now + delay
+            self.repository.update(torrent)
+        return delay
@@ -1,46 +1,171 @@
 """Torrent repository for data persistence"""
 
-import json
+import heapq
 import logging
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from ..models import Torrent, TorrentStatus
+from .archive import TorrentArchive
+from .backends import StorageBackend, create_backend
 
 
 class TorrentRepository:
     """Repository for managing torrent data persistence"""
     
-    def __init__(self, db_path: str):
-        self.db_path = Path(db_path)
+    def __init__(self, db_path: str, backend: str = 'journal', archive_deleted: bool = False):
+        self.db_path = db_path
+        self.backend: StorageBackend = create_backend(backend, db_path)
+        # DELETED torrents are moved out of memory and the main store
+        self.archive: Optional[TorrentArchive] = None
+        if archive_deleted:
+            self.archive = TorrentArchive(str(Path(db_path).with_suffix('.archive.jsonl')))
         self.torrents: Dict[str, Torrent] = {}
+        self._by_status: Dict[TorrentStatus, Dict[str, Torrent]] = {s: {} for s in TorrentStatus}
+        self._status_of: Dict[str, TorrentStatus] = {}
+        self._batch_depth = 0
+        self._dirty: Set[str] = set()
+        self._deleted: Set[str] = set()
+        # Min-heap of (eviction key, id) for COMPLETED torrents, entries that
+        # no longer match _evict_keys are stale and skipped lazily
+        self._evict_heap: List[Tuple[int, str]] = []
+        self._evict_keys: Dict[str, int] = {}
         self.load()
     
     def load(self):
-        """Load torrents from JSON file"""
-        if self.db_path.exists():
-            try:
-                with open(self.db_path, 'r') as f:
-                    data = json.load(f)
-                    self.torrents = {
-                        k: Torrent.from_dict(v) for k, v in data.items()
-                    }
-                logging.info(f"✓ Loaded {len(self.torrents)} torrents from database")
-            except Exception as e:
-                logging.error(f"Failed to load torrent database: {e}")
+        """Load torrents from the storage backend"""
+        try:
+            data = self.backend.load()
+            self.torrents = {
+                k: Torrent.from_dict(v) for k, v in data.items()
+            }
+            self._rebuild_indexes()
+            logging.info(f"✓ Loaded {len(self.torrents)} torrents from database")
+        except Exception as e:
+            logging.error(f"Failed to load torrent database: {e}")
+            return
+        
+        deleted = list(self._by_status[TorrentStatus.DELETED])
+        if self.archive is not None and deleted:
+            self._archive(deleted)
+            self.flush()
+            logging.info(f"✓ Moved {len(deleted)} deleted torrents to the archive")
     
     def save(self):
-        """Save torrents to JSON file"""
+        """Write a full snapshot of all torrents"""
+        try:
+            self.backend.snapshot({k: v.to_dict() for k, v in self.torrents.items()})
+            self._dirty.clear()
+            self._deleted.clear()
+        except Exception as e:
+            logging.error(f"Failed to save torrent database: {e}")
+    
+    @contextmanager
+    def batch(self):
+        """Group changes so they are written once when the block exits"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+    
+    def flush(self):
+        """Durably write pending changes"""
+        if self.archive is not None:
+            self._archive([
+                torrent_id for torrent_id in self._dirty
+                if torrent_id in self.torrents
+                and self.torrents[torrent_id].status == TorrentStatus.DELETED
+            ])
+        if not self._dirty and not self._deleted:
+            return
+        upserts = {
+            torrent_id: self.torrents[torrent_id].to_dict()
+            for torrent_id in self._dirty if torrent_id in self.torrents
+        }
         try:
-            with open(self.db_path, 'w') as f:
-                data = {k: v.to_dict() for k, v in self.torrents.items()}
-                json.dump(data, f, indent=2)
+            self.backend.write(upserts, self._deleted)
+            self._dirty.clear()
+            self._deleted.clear()
+            if self.backend.needs_compaction:
+                self.save()
         except Exception as e:
             logging.error(f"Failed to save torrent database: {e}")
     
+    def _archive(self, torrent_ids: List[str]):
+        """Move torrents to the archive and drop them from the main store"""
+        if not torrent_ids:
+            return
+        self.archive.append([self.torrents[torrent_id].to_dict() for torrent_id in torrent_ids])
+        for torrent_id in torrent_ids:
+            self._index(self.torrents.pop(torrent_id), removed=True)
+            self._dirty.discard(torrent_id)
+            self._deleted.add(torrent_id)
+    
+    def iter_archived(self) -> Iterable[Torrent]:
+        """Stream archived torrents from disk"""
+        if self.archive is None:
+            return
+        for record in self.archive:
+            yield Torrent.from_dict(record)
+    
+    def _changed(self, torrent_id: str, deleted: bool = False):
+        """Record a change and write it unless a batch is open"""
+        if deleted:
+            self._dirty.discard(torrent_id)
+            self._deleted.add(torrent_id)
+        else:
+            self._deleted.discard(torrent_id)
+            self._dirty.add(torrent_id)
+        if self._batch_depth == 0:
+            self.flush()
+    
+    @staticmethod
+    def _eviction_key(torrent: Torrent) -> int:
+        return torrent.completed_ts or torrent.added_ts
+    
+    def _rebuild_indexes(self):
+        """Rebuild secondary indexes from scratch"""
+        self._by_status = {s: {} for s in TorrentStatus}
+        self._status_of = {}
+        for torrent in self.torrents.values():
+            self._by_status[torrent.status][torrent.id] = torrent
+            self._status_of[torrent.id] = torrent.status
+        self._evict_keys = {
+            t.id: self._eviction_key(t)
+            for t in self.torrents.values() if t.status == TorrentStatus.COMPLETED
+        }
+        self._evict_heap = [(key, torrent_id) for torrent_id, key in self._evict_keys.items()]
+        heapq.heapify(self._evict_heap)
+    
+    def _index(self, torrent: Torrent, removed: bool = False):
+        """Keep secondary indexes in step with a changed torrent"""
+        previous = self._status_of.pop(torrent.id, None)
+        if previous is not None:
+            self._by_status[previous].pop(torrent.id, None)
+        if not removed:
+            self._by_status[torrent.status][torrent.id] = torrent
+            self._status_of[torrent.id] = torrent.status
+        
+        if removed or torrent.status != TorrentStatus.COMPLETED:
+            self._evict_keys.pop(torrent.id, None)
+        else:
+            key = self._eviction_key(torrent)
+            if self._evict_keys.get(torrent.id) != key:
+                self._evict_keys[torrent.id] = key
+                heapq.heappush(self._evict_heap, (key, torrent.id))
+        
+        if len(self._evict_heap) > 2 * len(self._evict_keys) + 64:
+            self._evict_heap = [(key, torrent_id) for torrent_id, key in self._evict_keys.items()]
+            heapq.heapify(self._evict_heap)
+    
     def add(self, torrent: Torrent):
         """Add a torrent"""
         self.torrents[torrent.id] = torrent
-        self.save()
+        self._index(torrent)
+        self._changed(torrent.id)
     
     def get(self, torrent_id: str) -> Optional[Torrent]:
         """Get a torrent by ID"""
@@ -52,21 +177,38 @@ class TorrentRepository:
     
     def get_by_status(self, status: TorrentStatus) -> List[Torrent]:
         """Get torrents by status"""
-        return [t for t in self.torrents.values() if t.status == status]
+        return list(self._by_status[status].values())
+    
+    def iter_evictable(self) -> Iterator[Torrent]:
+        """Yield COMPLETED torrents oldest first
+        
+        Walks the heap in order without modifying it, so taking the first k
+        torrents costs O(k log k). The repository must not be changed while
+        iterating.
+        """
+        heap = self._evict_heap
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier:
+            (key, torrent_id), i = heapq.heappop(frontier)
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+            if self._evict_keys.get(torrent_id) == key:
+                yield self.torrents[torrent_id]
     
     def update(self, torrent: Torrent):
         """Update a torrent"""
         if torrent.id in self.torrents:
             self.torrents[torrent.id] = torrent
-            self.save()
+            self._index(torrent)
+            self._changed(torrent.id)
     
     def delete(self, torrent_id: str):
         """Delete a torrent"""
         if torrent_id in self.torrents:
-            del self.torrents[torrent_id]
-            self.save()
+            self._index(self.torrents.pop(torrent_id), removed=True)
+            self._changed(torrent_id, deleted=True)
     
     def exists(self, torrent_id: str) -> bool:
         """Check if torrent exists"""
         return torrent_id in self.torrents
-
@@ -0,0 +1,156 @@
+"""Index of FileList IDs that were already handled"""
+
+import json
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Union
+
+
+class SeenIndex:
+    """Compact set of handled torrent IDs with a floor and high-water mark
+    
+    FileList IDs grow monotonically, so only the most recent ``capacity``
+    IDs are kept in memory. Everything at or below ``floor`` counts as seen.
+    Per feed, the poll mark is the newest ID up to which a poll handled
+    every entry, so reading a newest-first feed can stop there.
+    
+    Entries the filters turned down are not handled: seeders and freeleech
+    change after a torrent is posted. They are rejections, read and
+    filtered again on every poll for ``recheck_seconds`` after the first
+    one, and the poll mark stays below them until then. Feeds can filter
+    differently, so rejections are kept per feed; only handled IDs are
+    shared between feeds.
+    """
+    
+    def __init__(self, path: Optional[str] = None, capacity: int = 5000,
+                 recheck_seconds: float = 86400):
+        self.path = Path(path) if path else None
+        self.capacity = capacity
+        self.recheck_seconds = recheck_seconds
+        self.floor = 0
+        self.high_water_mark = 0
+        self.poll_marks: Dict[str, int] = {}
+        # Feed key -> ID -> time the feed's filters first turned it down
+        self.rejections: Dict[str, Dict[int, int]] = {}
+        self._ids: Set[int] = set()
+        self.load()
+    
+    def __contains__(self, torrent_id: Union[str, int]) -> bool:
+        value = int(torrent_id)
+        return value <= self.floor or value in self._ids
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def add(self, torrent_id: Union[str, int]):
+        """Mark an ID as handled"""
+        value = int(torrent_id)
+        if value <= self.floor:
+            return
+        for rejected in self.rejections.values():
+            rejected.pop(value, None)
+        self._ids.add(value)
+        if value > self.high_water_mark:
+            self.high_water_mark = value
+        if len(self._ids) > self.capacity + self.capacity // 4:
+            self._compact()
+    
+    def update(self, torrent_ids: Iterable[Union[str, int]]):
+        """Mark several IDs as handled"""
+        for torrent_id in torrent_ids:
+            self.add(torrent_id)
+    
+    def reject(self, feed_key: str, torrent_id: Union[str, int], now: Optional[int] = None):
+        """Record that a feed's filters turned an entry down"""
+        value = int(torrent_id)
+        if value in self:
+            return
+        self.rejections.setdefault(feed_key, {}).setdefault(
+            value, int(time.time()) if now is None else now
+        )
+    
+    def skips(self, feed_key: str, torrent_id: Union[str, int], now: Optional[int] = None) -> bool:
+        """Whether a feed needs no further look at an entry: handled, or rejected too long ago"""
+        if torrent_id in self:
+            return True
+        rejected = self.rejections.get(feed_key, {}).get(int(torrent_id))
+        if rejected is None:
+            return False
+        now = int(time.time()) if now is None else now
+        return now - rejected >= self.recheck_seconds
+    
+    def get_poll_mark(self, feed_key: str) -> int:
+        """Newest ID up to which every entry of a feed was handled"""
+        return self.poll_marks.get(feed_key, 0)
+    
+    def advance_poll_mark(self, feed_key: str, torrent_id: Union[str, int],
+                          now: Optional[int] = None):
+        """Record that every entry of a feed up to torrent_id was handled
+        
+        The mark stops below the oldest rejection that is still rechecked.
+        """
+        now = int(time.time()) if now is None else now
+        mark = int(torrent_id)
+        rejections = self.rejections.get(feed_key, {})
+        rechecked = [
+            value for value, rejected in rejections.items()
+            if value <= mark and now - rejected < self.recheck_seconds
+        ]
+        if rechecked:
+            mark = min(rechecked) - 1
+        self.poll_marks[feed_key] = max(self.get_poll_mark(feed_key), mark)
+        
+        # Rejections behind the feed's poll mark are never read again
+        self.rejections[feed_key] = {
+            value: rejected for value, rejected in rejections.items()
+            if value > self.poll_marks[feed_key]
+        }
+    
+    def _compact(self):
+        """Drop the oldest IDs and raise the floor"""
+        ordered = sorted(self._ids)
+        dropped = ordered[:-self.capacity]
+        self._ids = set(ordered[-self.capacity:])
+        self.floor = max(self.floor, dropped[-1])
+        self.rejections = {
+            feed_key: {
+                value: rejected for value, rejected in rejections.items() if value > self.floor
+            }
+            for feed_key, rejections in self.rejections.items()
+        }
+    
+    def load(self):
+        """Load index from JSON file"""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            self.floor = data.get('floor', 0)
+            self._ids = set(data.get('ids', []))
+            self.high_water_mark = max(self._ids, default=self.floor)
+            self.poll_marks = data.get('poll_marks', {})
+            self.rejections = {
+                feed_key: {int(k): v for k, v in rejections.items()}
+                for feed_key, rejections in data.get('rejections', {}).items()
+            }
+        except Exception as e:
+            logging.error(f"Failed to load seen index: {e}")
+    
+    def save(self):
+        """Save index to JSON file"""
+        if not self.path:
+            return
+        try:
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump({
+                    'floor': self.floor,
+                    'poll_marks': self.poll_marks,
+                    'rejections': self.rejections,
+                    'ids': sorted(self._ids),
+                }, f)
+            tmp_path.replace(self.path)
+        except Exception as e:
+            logging.error(f"Failed to save seen index: {e}")
@@ -2,44 +2,45 @@
 
 import logging
 from pathlib import Path
-from typing import List
-from ..models import Torrent, TorrentStatus
+from ..models import Torrent
+from .usage_tracker import UsageTracker
 
 
 class StorageManager:
     """Manages storage and enforces size limits"""
     
-    def __init__(self, download_path: str, max_size_gb: float):
+    def __init__(self, download_path: str, max_size_gb: float, rescan_interval: float = 3600):
         self.download_path = Path(download_path)
         self.max_size_bytes = int(max_size_gb * 1024**3)
+        self.usage = UsageTracker(download_path, rescan_interval)
+        self.usage.start()
+        logging.info(f"✓ Download folder uses {self.usage.used_bytes / (1024**3):.2f} GB")
     
     def get_folder_size(self) -> int:
-        """Calculate total size of download folder"""
-        total_size = 0
-        try:
-            if not self.download_path.exists():
-                return 0
-            for item in self.download_path.rglob('*'):
-                if item.is_file():
-                    total_size += item.stat().st_size
-        except Exception as e:
-            logging.error(f"Failed to calculate folder size: {e}")
-        return total_size
-    
-    def needs_cleanup(self, additional_size: int = 0) -> bool:
-        """Check if cleanup is needed"""
-        current_size = self.get_folder_size()
-        return (current_size + additional_size) > self.max_size_bytes
+        """Get tracked size of download folder"""
+        return self.usage.used_bytes
+    
+    def reserve(self, torrent: Torrent, resumed: bool = False):
+        """Hold space for a torrent the client is downloading"""
+        self.usage.reserve(torrent.id, torrent.size, resumed)
+    
+    def record_progress(self, torrent: Torrent, written: int):
+        """Account for the bytes of a download the client has written"""
+        self.usage.record_progress(torrent.id, written)
     
-    def get_oldest_torrents(self, torrents: List[Torrent], count: int = 1) -> List[Torrent]:
-        """Get oldest completed torrents"""
-        completed = [t for t in torrents if t.status == TorrentStatus.COMPLETED]
-        # Sort by completion date (oldest first)
-        completed.sort(key=lambda t: t.completed_date or t.added_date)
-        return completed[:count]
+    def release(self, torrent: Torrent, completed: bool = True):
+        """Stop holding space for a torrent that finished or went away"""
+        self.usage.release(torrent.id, completed)
+    
+    def record_removed(self, size: int):
+        """Account for a torrent removed from the download folder"""
+        self.usage.record_removed(size)
+    
+    def space_to_free(self, additional_size: int = 0) -> int:
+        """Bytes that must be freed before additional_size fits"""
+        return max(0, self.get_folder_size() + additional_size - self.max_size_bytes)
     
     def get_usage_percent(self) -> float:
         """Get storage usage percentage"""
         current_size = self.get_folder_size()
         return (current_size / self.max_size_bytes) * 100
-
@@ -0,0 +1,177 @@
+"""Incremental disk usage tracker"""
+
+import os
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class _Reservation:
+    """Space held for one download that is still in progress"""
+    
+    __slots__ = ('size', 'written', 'on_disk', 'resumed')
+    
+    def __init__(self, size: int, resumed: bool = False):
+        self.size = size
+        self.written = 0  # bytes the client reports as downloaded
+        self.on_disk = 0  # part of written already counted by a rescan
+        self.resumed = resumed  # started before the last walk, progress not known yet
+    
+    @property
+    def outstanding(self) -> int:
+        return max(0, self.size - self.on_disk)
+
+
+class UsageTracker:
+    """Keeps a running total of bytes used under a directory
+    
+    The tree is walked once at startup, after that the total is kept up to
+    date from add/remove events. A background thread re-walks the tree every
+    ``rescan_interval`` seconds to correct any drift (files removed by hand,
+    ...).
+    
+    Downloads in progress hold a reservation for their full size. A rescan
+    only sees what was written so far, so it shrinks the reservation by the
+    progress the client reported before the walk instead of dropping it.
+    """
+    
+    def __init__(self, path: str, rescan_interval: float = 3600):
+        self.path = Path(path)
+        self.rescan_interval = rescan_interval
+        self._lock = threading.Lock()
+        self._disk_bytes = 0
+        self._delta = 0
+        self._reservations: Dict[str, _Reservation] = {}
+        self._reserved = 0
+        self._scan_generation = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.rescan()
+    
+    @property
+    def used_bytes(self) -> int:
+        """Current estimate of used bytes (O(1))"""
+        with self._lock:
+            return max(0, self._disk_bytes + self._delta + self._reserved)
+    
+    def reserve(self, key: str, size: int, resumed: bool = False):
+        """Hold space for a download that is about to be written
+        
+        A ``resumed`` download was already partly on disk when the tree was
+        walked, its first reported progress is taken as counted.
+        """
+        with self._lock:
+            self._drop(key)
+            self._reservations[key] = _Reservation(size, resumed)
+            self._reserved += size
+    
+    def record_progress(self, key: str, written: int):
+        """Note how many bytes of a reserved download are on disk"""
+        with self._lock:
+            reservation = self._reservations.get(key)
+            if reservation is None:
+                return
+            reservation.written = min(max(0, written), reservation.size)
+            if reservation.resumed:
+                reservation.resumed = False
+                self._reserved -= reservation.outstanding
+                reservation.on_disk = reservation.written
+                self._reserved += reservation.outstanding
+    
+    def release(self, key: str, completed: bool = True):
+        """Drop a reservation, a completed download keeps its unscanned bytes"""
+        with self._lock:
+            reservation = self._drop(key)
+            # A resumed download that completes before reporting progress was
+            # all but done when the tree was walked
+            if reservation is not None and completed and not reservation.resumed:
+                # Written since the last rescan, the next one counts it
+                self._delta += reservation.outstanding
+    
+    def _drop(self, key: str) -> Optional[_Reservation]:
+        reservation = self._reservations.pop(key, None)
+        if reservation is not None:
+            self._reserved -= reservation.outstanding
+        return reservation
+    
+    def record_removed(self, size: int):
+        """Account for data that was removed"""
+        with self._lock:
+            self._delta -= size
+    
+    def rescan(self) -> int:
+        """Walk the tree and replace the running total with the real size"""
+        with self._lock:
+            self._scan_generation += 1
+            generation = self._scan_generation
+            delta_before = self._delta
+            written = {key: r.written for key, r in self._reservations.items()}
+        
+        disk_bytes = self._walk(self.path)
+        
+        with self._lock:
+            if generation == self._scan_generation:
+                # Events recorded while walking are kept on top of the result
+                self._delta -= delta_before
+                self._disk_bytes = disk_bytes
+                # What downloads had written before the walk is in disk_bytes now
+                for key, on_disk in written.items():
+                    reservation = self._reservations.get(key)
+                    if reservation is not None:
+                        self._reserved -= reservation.outstanding
+                        reservation.on_disk = on_disk
+                        self._reserved += reservation.outstanding
+            return max(0, self._disk_bytes + self._delta + self._reserved)
+    
+    def start(self):
+        """Start periodic background rescans"""
+        if self._thread is not None or self.rescan_interval <= 0:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name='usage-tracker', daemon=True
+        )
+        self._thread.start()
+    
+    def stop(self):
+        """Stop background rescans"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+    
+    def _run(self):
+        while not self._stop.wait(self.rescan_interval):
+            try:
+                before = self.used_bytes
+                after = self.rescan()
+                logging.debug(
+                    f"Storage rescan: {before / (1024**3):.2f} GB tracked, "
+                    f"{after / (1024**3):.2f} GB on disk"
+                )
+            except Exception as e:
+                logging.error(f"Failed to rescan download folder: {e}")
+    
+    @staticmethod
+    def _walk(root: Path) -> int:
+        """Sum file sizes below root using os.scandir"""
+        total = 0
+        if not root.exists():
+            return 0
+        stack = [str(root)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                total += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            continue
+            except OSError as e:
+                logging.debug(f"Skipping {current}: {e}")
+        return total
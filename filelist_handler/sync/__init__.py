@@ -0,0 +1,5 @@
+"""Torrent client state synchronization"""
+
+from .state_sync import ClientStateSync, client_tag
+
+__all__ = ['ClientStateSync', 'client_tag']
@@ -0,0 +1,219 @@
+"""Synchronize torrent client state into the repository"""
+
+import re
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+from ..clients import TorrentClient
+from ..models import Torrent, TorrentStatus
+from ..storage import StorageManager, TorrentRepository
+
+# Client states that mean the data is unusable
+ERROR_STATES = {'error', 'missingFiles'}
+
+TAG_PATTERN = re.compile(r'\[[^\]]*\]')
+NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9]+')
+
+# Torrents are added with this tag followed by their FileList ID
+TAG_PREFIX = 'filelist-'
+
+# Syncs after which a download the client never matched gives up its space
+UNLINKED_SYNC_LIMIT = 10
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a release name so feed titles match client torrent names"""
+    return NON_ALNUM_PATTERN.sub('', TAG_PATTERN.sub('', name).lower())
+
+
+def client_tag(torrent_id: str) -> str:
+    """Tag that links a client torrent to its FileList ID"""
+    return f"{TAG_PREFIX}{torrent_id}"
+
+
+def tagged_ids(tags: str) -> List[str]:
+    """FileList IDs in a client's comma separated tags"""
+    return [
+        tag[len(TAG_PREFIX):] for tag in (t.strip() for t in tags.split(','))
+        if tag.startswith(TAG_PREFIX)
+    ]
+
+
+class ClientStateSync:
+    """Applies incremental torrent client updates to the repository
+    
+    Keeps the ``rid`` cursor and a local mirror of the client's torrents so
+    each poll only transfers what changed. Client hashes are linked to
+    repository torrents by ``info_hash`` or, the first time a torrent shows
+    up, by its ``filelist-<id>`` tag. Torrents without a single such tag
+    are matched by name against the feed titles, or get the one tagged
+    download that is left once the others are linked. Tagged hashes that
+    match nothing are tried again on every sync.
+    
+    With a ``storage`` manager, downloads hold their reserved space until
+    the client reports them completed, and report their progress so disk
+    rescans do not count written bytes twice. Downloads still unlinked
+    after ``UNLINKED_SYNC_LIMIT`` syncs release their space.
+    """
+    
+    def __init__(self, client: TorrentClient, repository: TorrentRepository,
+                 storage: Optional[StorageManager] = None):
+        self.client = client
+        self.repository = repository
+        self.storage = storage
+        self.rid = 0
+        self.state: Dict[str, dict] = {}
+        self._by_name: Optional[Dict[str, Torrent]] = None  # per sync, see _match_name
+        self._unlinked_hashes: Set[str] = set()
+        self._unlinked_syncs: Dict[str, int] = {}  # torrent ID -> syncs without a hash
+        self.hash_to_id: Dict[str, str] = {
+            t.info_hash: t.id for t in repository.get_all() if t.info_hash
+        }
+        if storage is not None:
+            # Downloads from before a restart; the startup walk already
+            # counted what they wrote, the first sync says how much that was
+            for torrent in repository.get_by_status(TorrentStatus.DOWNLOADING):
+                storage.reserve(torrent, resumed=True)
+    
+    def sync(self) -> List[Torrent]:
+        """Pull client changes and update the repository in one batch
+        
+        Returns the torrents that completed since the last sync.
+        """
+        data = self.client.sync_torrents(self.rid)
+        if data.get('full_update'):
+            self.state = {}
+            self._unlinked_hashes = set()
+        self.rid = data.get('rid', 0)
+        
+        changed = data.get('torrents', {})
+        for torrent_hash, fields in changed.items():
+            self.state.setdefault(torrent_hash, {}).update(fields)
+        
+        completed = []
+        self._by_name = None
+        # Changed hashes first, they may link what the retried ones wait for
+        pending = list(changed) + [h for h in self._unlinked_hashes if h not in changed]
+        with self.repository.batch():
+            for torrent_hash in pending:
+                torrent = self._resolve(torrent_hash)
+                if torrent_hash in self.hash_to_id:
+                    self._unlinked_hashes.discard(torrent_hash)
+                elif tagged_ids(self.state[torrent_hash].get('tags') or ''):
+                    self._unlinked_hashes.add(torrent_hash)
+                if torrent and self._apply(torrent, self.state[torrent_hash]):
+                    completed.append(torrent)
+            
+            for torrent_hash in data.get('torrents_removed', []):
+                self.state.pop(torrent_hash, None)
+                self._unlinked_hashes.discard(torrent_hash)
+                torrent_id = self.hash_to_id.pop(torrent_hash, None)
+                torrent = self.repository.get(torrent_id) if torrent_id else None
+                if torrent and torrent.status != TorrentStatus.DELETED:
+                    self._release(torrent, completed=False)
+                    torrent.status = TorrentStatus.DELETED
+                    self.repository.update(torrent)
+            
+            if self.storage is not None:
+                self._expire_unlinked()
+        return completed
+    
+    def _resolve(self, torrent_hash: str) -> Optional[Torrent]:
+        """Find the repository torrent for a client hash"""
+        torrent_id = self.hash_to_id.get(torrent_hash)
+        if torrent_id:
+            return self.repository.get(torrent_id)
+        
+        state = self.state[torrent_hash]
+        # A batch add puts the tags of all its torrents on each of them
+        ids = tagged_ids(state.get('tags') or '')
+        torrent = self.repository.get(ids[0]) if len(ids) == 1 else None
+        if torrent is None:
+            torrent = self._match_name(state.get('name', ''), ids)
+        if torrent is None and len(ids) > 1:
+            torrent = self._eliminate(ids)
+        if torrent is None or torrent.info_hash or torrent.status != TorrentStatus.DOWNLOADING:
+            return None
+        
+        torrent.info_hash = torrent_hash
+        self.hash_to_id[torrent_hash] = torrent.id
+        self.repository.update(torrent)
+        if self._by_name is not None:
+            self._by_name.pop(normalize_name(torrent.title), None)
+        return torrent
+    
+    def _match_name(self, name: str, ids: List[str]) -> Optional[Torrent]:
+        """Unlinked download whose title matches a client torrent name"""
+        name = normalize_name(name)
+        if not name:
+            return None
+        if self._by_name is None:
+            # Built once per sync, on the first torrent that needs it
+            self._by_name = {
+                normalize_name(t.title): t
+                for t in self.repository.get_by_status(TorrentStatus.DOWNLOADING)
+                if not t.info_hash
+            }
+        torrent = self._by_name.get(name)
+        if torrent is not None and ids and torrent.id not in ids:
+            return None
+        return torrent
+    
+    def _eliminate(self, ids: List[str]) -> Optional[Torrent]:
+        """The only tagged download that is not linked yet"""
+        unlinked = [
+            torrent for torrent in (self.repository.get(torrent_id) for torrent_id in ids)
+            if torrent is not None and torrent.status == TorrentStatus.DOWNLOADING
+            and not torrent.info_hash
+        ]
+        return unlinked[0] if len(unlinked) == 1 else None
+    
+    def _expire_unlinked(self):
+        """Release the space of downloads no client torrent was linked to"""
+        unlinked = {
+            t.id: t for t in self.repository.get_by_status(TorrentStatus.DOWNLOADING)
+            if not t.info_hash
+        }
+        self._unlinked_syncs = {
+            torrent_id: self._unlinked_syncs.get(torrent_id, 0) + 1 for torrent_id in unlinked
+        }
+        for torrent_id, syncs in self._unlinked_syncs.items():
+            if syncs == UNLINKED_SYNC_LIMIT:
+                torrent = unlinked[torrent_id]
+                logging.warning(
+                    f"✗ {torrent.title} is not linked to a client torrent after "
+                    f"{syncs} syncs, releasing its reserved space"
+                )
+                self.storage.release(torrent, completed=False)
+    
+    def _apply(self, torrent: Torrent, state: dict) -> bool:
+        """Update status from client state, returns True when it just completed"""
+        if torrent.status != TorrentStatus.DOWNLOADING:
+            return False
+        
+        if state.get('state') in ERROR_STATES:
+            self._release(torrent, completed=False)
+            torrent.status = TorrentStatus.ERROR
+            self.repository.update(torrent)
+            return False
+        
+        progress = state.get('progress', 0)
+        if progress >= 1:
+            self._release(torrent, completed=True)
+            completion_on = state.get('completion_on') or 0
+            torrent.status = TorrentStatus.COMPLETED
+            torrent.completed_date = (
+                datetime.fromtimestamp(completion_on) if completion_on > 0 else datetime.now()
+            )
+            self.repository.update(torrent)
+            logging.debug(f"Client reports {torrent.title} as completed")
+            return True
+        
+        if self.storage is not None:
+            size = torrent.size or state.get('size', 0)
+            self.storage.record_progress(torrent, int(size * progress))
+        return False
+    
+    def _release(self, torrent: Torrent, completed: bool):
+        if self.storage is not None and torrent.status == TorrentStatus.DOWNLOADING:
+            self.storage.release(torrent, completed)
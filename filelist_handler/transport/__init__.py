@@ -0,0 +1,5 @@
+"""HTTP transport shared by feeds and torrent clients"""
+
+from .http_transport import HttpTransport, TimeoutSession
+
+__all__ = ['HttpTransport', 'TimeoutSession']
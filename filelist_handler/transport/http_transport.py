@@ -0,0 +1,63 @@
+"""Shared HTTP connection pool"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Tuple
+from urllib3.util.retry import Retry
+
+# Server errors worth retrying; 429 honours Retry-After
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class TimeoutSession(requests.Session):
+    """Session that applies a default timeout to every request"""
+    
+    def __init__(self, timeout: Tuple[float, float]):
+        super().__init__()
+        self.timeout = timeout
+    
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+class HttpTransport:
+    """One keep-alive connection pool for the tracker and the torrent client
+    
+    Every request gets connect and read timeouts so a hung server cannot
+    stall the daemon. Idempotent requests (GET, HEAD, PUT, DELETE) are
+    retried with exponential backoff on connection errors and 5xx answers;
+    POSTs are never replayed, since adding a torrent twice is not harmless.
+    """
+    
+    def __init__(self, pool_size: int = 10, connect_timeout: float = 10,
+                 read_timeout: float = 30, retries: int = 3, backoff_factor: float = 0.5):
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = TimeoutSession(self.timeout)
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+    
+    @classmethod
+    def from_config(cls, config) -> 'HttpTransport':
+        """Create a transport from the http section of the configuration"""
+        return cls(
+            config.get('http.pool_size', 10),
+            config.get('http.connect_timeout', 10),
+            config.get('http.read_timeout', 30),
+            config.get('http.retries', 3),
+            config.get('http.backoff_factor', 0.5)
+        )
+    
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
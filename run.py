@@ -5,16 +5,38 @@ Run this file to start the application
 """
 
 import sys
+import argparse
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from filelist_handler.main import FileListHandler
+from filelist_handler.config import Config
+from filelist_handler.metrics import load_snapshot, format_stats
+
+
+def show_stats() -> int:
+    """Print the metrics saved by the running handler"""
+    path = Config().get('metrics.file', 'metrics.json')
+    try:
+        snapshot = load_snapshot(path)
+    except (OSError, ValueError) as e:
+        print(f"✗ No metrics in {path} yet: {e}")
+        return 1
+    print(format_stats(snapshot))
+    return 0
 
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description='FileList RSS Handler')
+    parser.add_argument('--stats', action='store_true',
+                        help='print latency and counters of the running handler and exit')
+    args = parser.parse_args()
+    if args.stats:
+        sys.exit(show_stats())
+    
     handler = FileListHandler()
     handler.run()
 
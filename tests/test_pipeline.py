@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for the pipeline stages and the feed check built on them
+"""
+
+import sys
+import time
+import threading
+import unittest
+from contextlib import nullcontext
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from filelist_handler.metrics import MetricsRegistry
+from filelist_handler.models import Torrent
+from filelist_handler.pipeline import FeedCycle, Pipeline, Stage
+
+
+def make_torrent(torrent_id: str) -> Torrent:
+    return Torrent(torrent_id, f"Release {torrent_id}", f"https://filelist.io/download.php?id={torrent_id}",
+                   1024, True, int(time.time()))
+
+
+class StageTest(unittest.TestCase):
+    def run_stages(self, batch_size, items):
+        received = []
+        
+        def source(_, emit):
+            for item in items:
+                emit(item)
+        
+        Pipeline([
+            Stage('source', source),
+            Stage('sink', lambda item, emit: received.append(item), batch_size=batch_size),
+        ]).run()
+        return received
+    
+    def test_single_items_without_batch_size(self):
+        self.assertEqual(self.run_stages(None, [1, 2]), [1, 2])
+    
+    def test_batch_size_one_still_gets_lists(self):
+        self.assertEqual(self.run_stages(1, [1, 2]), [[1], [2]])
+    
+    def test_batches_never_exceed_batch_size(self):
+        batches = self.run_stages(3, list(range(10)))
+        self.assertEqual([item for batch in batches for item in batch], list(range(10)))
+        self.assertTrue(all(1 <= len(batch) <= 3 for batch in batches))
+
+
+class FeedCycleLimitTest(unittest.TestCase):
+    def make_handler(self, limit: int, retries):
+        submitted = []
+        
+        def submit_torrents(torrents):
+            submitted.append(torrents)
+            return list(torrents)
+        
+        handler = SimpleNamespace(
+            max_torrents_per_run=limit,
+            selector=None,
+            outbox=SimpleNamespace(due=lambda: list(retries)),
+            profiler=SimpleNamespace(thread=nullcontext),
+            feed_poller=SimpleNamespace(poll=lambda feeds, seen, emit, stop: []),
+            state_lock=threading.RLock(),
+            repository=SimpleNamespace(exists=lambda torrent_id: True),
+            cleanup_storage=lambda required_space=0: True,
+            submit_torrents=submit_torrents,
+            metrics=MetricsRegistry(),
+        )
+        return handler, submitted
+    
+    def test_limit_one_submits_a_list(self):
+        torrent = make_torrent('1')
+        handler, submitted = self.make_handler(1, [torrent])
+        cycle = FeedCycle(handler, [])
+        stats = cycle.run()
+        
+        self.assertEqual(submitted, [[torrent]])
+        self.assertEqual(cycle.added, [torrent])
+        self.assertEqual(stats['submit'].errors, 0)
+    
+    def test_limit_zero_still_submits_retries(self):
+        torrent = make_torrent('2')
+        handler, submitted = self.make_handler(0, [torrent])
+        cycle = FeedCycle(handler, [])
+        cycle.run()
+        
+        self.assertEqual(submitted, [[torrent]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Tests for the Transmission RPC client against a local fake RPC server
+"""
+
+import sys
+import json
+import unittest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from filelist_handler.clients.transmission import (
+    RECENTLY_ACTIVE_SECONDS, SESSION_HEADER, TransmissionClient
+)
+
+
+class FakeTransmission(BaseHTTPRequestHandler):
+    """Answers the RPC calls the client makes, like Transmission would"""
+    
+    server: 'FakeServer'
+    
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        if self.headers.get(SESSION_HEADER) != self.server.session_id:
+            self.server.handshakes += 1
+            self._reply(409, {}, {SESSION_HEADER: self.server.session_id})
+            return
+        self.server.calls.append(body)
+        handler = getattr(self.server, 'rpc_' + body['method'].replace('-', '_'))
+        self._reply(200, {'result': 'success', 'arguments': handler(body['arguments'])})
+    
+    def _reply(self, status: int, data: dict, headers: dict = None):
+        payload = json.dumps(data).encode()
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def log_message(self, *args):
+        pass
+
+
+class FakeServer(ThreadingHTTPServer):
+    """Keeps the torrents and the calls made to the fake RPC endpoint"""
+    
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), FakeTransmission)
+        self.session_id = 'session-1'
+        self.handshakes = 0
+        self.calls = []
+        self.torrents = {}  # id -> torrent-get fields
+        self.removed = []
+        self.next_id = 1
+    
+    def rpc_session_get(self, arguments):
+        return {'version': '4.0.5'}
+    
+    def rpc_torrent_add(self, arguments):
+        url = arguments['filename']
+        for torrent in self.torrents.values():
+            if torrent['name'] == url:
+                return {'torrent-duplicate': {'id': torrent['id']}}
+        torrent_id = self.next_id
+        self.next_id += 1
+        self.torrents[torrent_id] = {
+            'id': torrent_id, 'hashString': f"{torrent_id:040x}", 'name': url,
+            'percentDone': 0.0, 'status': 4, 'error': 0, 'doneDate': 0, 'totalSize': 1024,
+        }
+        return {'torrent-added': {'id': torrent_id}}
+    
+    def rpc_torrent_get(self, arguments):
+        torrents = [
+            {field: t[field] for field in arguments['fields']} for t in self.torrents.values()
+        ]
+        if arguments.get('ids') == 'recently-active':
+            return {'torrents': torrents, 'removed': self.removed}
+        return {'torrents': torrents}
+    
+    def rpc_torrent_remove(self, arguments):
+        for torrent_id, torrent in list(self.torrents.items()):
+            if torrent['hashString'] in arguments['ids']:
+                del self.torrents[torrent_id]
+                self.removed.append(torrent_id)
+        return {}
+
+
+class TransmissionClientTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.client = TransmissionClient(f"http://127.0.0.1:{self.server.server_port}", 'user', 'pass')
+    
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def test_session_handshake(self):
+        self.assertTrue(self.client.connect())
+        self.assertEqual(self.client.session_id, 'session-1')
+        self.assertEqual(self.server.handshakes, 1)
+        
+        # A restarted daemon hands out a new ID, the call is repeated once
+        self.server.session_id = 'session-2'
+        self.assertTrue(self.client.connect())
+        self.assertEqual(self.client.session_id, 'session-2')
+        self.assertEqual(self.server.handshakes, 2)
+        self.assertEqual(len(self.server.calls), 2)
+    
+    def test_add_torrents(self):
+        urls = ['https://filelist.io/download.php?id=1', 'https://filelist.io/download.php?id=2']
+        self.assertEqual(self.client.add_torrents(urls, '/downloads'), [True, True])
+        # Already in the client counts as added
+        self.assertEqual(self.client.add_torrents(urls[:1], '/downloads'), [True])
+        self.assertEqual(len(self.server.torrents), 2)
+        self.assertEqual(self.server.calls[0]['arguments']['download-dir'], '/downloads')
+    
+    def test_sync_torrents(self):
+        self.client.add_torrents(['a', 'b'], '/downloads')
+        first = self.client.sync_torrents(0)
+        self.assertTrue(first['full_update'])
+        self.assertEqual(set(first['torrents']), {f"{1:040x}", f"{2:040x}"})
+        self.assertNotIn('ids', self.server.calls[-1]['arguments'])
+        
+        self.server.torrents[1]['percentDone'] = 1.0
+        second = self.client.sync_torrents(first['rid'])
+        self.assertFalse(second['full_update'])
+        self.assertEqual(self.server.calls[-1]['arguments']['ids'], 'recently-active')
+        self.assertEqual(second['torrents'][f"{1:040x}"]['progress'], 1.0)
+    
+    def test_sync_after_long_pause_is_full(self):
+        self.client.add_torrents(['a', 'b'], '/downloads')
+        first = self.client.sync_torrents(0)
+        
+        # Removed while recently-active would no longer report it
+        del self.server.torrents[2]
+        self.client._synced_at -= RECENTLY_ACTIVE_SECONDS + 1
+        second = self.client.sync_torrents(first['rid'])
+        self.assertTrue(second['full_update'])
+        self.assertNotIn('ids', self.server.calls[-1]['arguments'])
+        self.assertEqual(second['torrents_removed'], [f"{2:040x}"])
+        self.assertEqual(list(second['torrents']), [f"{1:040x}"])
+    
+    def test_remove_torrents_in_one_call(self):
+        self.client.add_torrents(['a', 'b', 'c'], '/downloads')
+        first = self.client.sync_torrents(0)
+        
+        hashes = [f"{1:040x}", f"{3:040x}"]
+        self.assertTrue(self.client.remove_torrents(hashes, delete_files=True))
+        remove_calls = [c for c in self.server.calls if c['method'] == 'torrent-remove']
+        self.assertEqual(len(remove_calls), 1)
+        self.assertEqual(remove_calls[0]['arguments'], {'ids': hashes, 'delete-local-data': True})
+        
+        second = self.client.sync_torrents(first['rid'])
+        self.assertEqual(sorted(second['torrents_removed']), sorted(hashes))
+
+
+if __name__ == '__main__':
+    unittest.main()